@@ -1,18 +1,60 @@
+import json
+ 
 from aws_cdk import (
     Stack,
     aws_apigatewayv2 as apigw,
-    aws_apigatewayv2_integrations as integrations,
-    aws_apigatewayv2_authorizers as authorizers,
-    aws_logs as logs,
+    aws_ssm as ssm,
     CfnOutput,
 )
 from constructs import Construct
  
  
+# ---------------------------------------------------------
+# Protected Routes (JWT REQUIRED)
+# ---------------------------------------------------------
+# Built once at import time and shared by every stack instance.
+PROTECTED_ROUTES = (
+    "/auth/{proxy+}",
+    "/masters/{proxy+}",
+    "/jobs/{proxy+}",
+    "/attachments/{proxy+}",
+    "/reports/{proxy+}",
+)
+ 
+# ---------------------------------------------------------
+# Access log format (CloudWatch)
+# ---------------------------------------------------------
+# Serialized once; identical across stacks and synths.
+# Not attached to a stage yet: enabling stage access logging (log group,
+# retention, removal policy) is a separate infrastructure change.
+ACCESS_LOG_FORMAT = json.dumps(
+    {
+        "requestId": "$context.requestId",
+        "ip": "$context.identity.sourceIp",
+        "requestTime": "$context.requestTime",
+        "httpMethod": "$context.httpMethod",
+        "routeKey": "$context.routeKey",
+        "status": "$context.status",
+        "protocol": "$context.protocol",
+        "responseLength": "$context.responseLength",
+        "integrationLatency": "$context.integrationLatency",
+        "authorizerError": "$context.authorizer.error",
+    },
+    separators=(",", ":"),
+)
+ 
+ 
 class ApiGatewayStack(Stack):
-    def __init__(self, scope: Construct, construct_id: str, ec2_public_ip: str, **kwargs):
+    def __init__(self, scope: Construct, construct_id: str, ec2_ip_parameter_name: str, **kwargs):
         super().__init__(scope, construct_id, **kwargs)
  
+        # Backend IP is resolved from SSM at deploy time, so this stack
+        # has no synth-time dependency on the Ec2Stack object.
+        ec2_public_ip = ssm.StringParameter.value_for_string_parameter(
+            self,
+            ec2_ip_parameter_name,
+        )
+ 
         # ---------------------------------------------------------
         # HTTP API
         # ---------------------------------------------------------
@@ -28,49 +70,61 @@ class ApiGatewayStack(Stack):
         )
  
         # ---------------------------------------------------------
-        # Cognito JWT Authorizer
+        # Cognito JWT Authorizer (L1)
         # ---------------------------------------------------------
-        jwt_authorizer = authorizers.HttpJwtAuthorizer(
+        jwt_authorizer = apigw.CfnAuthorizer(
+            self,
             "CognitoJwtAuthorizer",
-            jwt_issuer=f"https://cognito-idp.ap-south-1.amazonaws.com/ap-south-1_M3xBYcen7",
-            jwt_audience=["5592g38cjskmpd9ceid24osugm"],
+            api_id=http_api.http_api_id,
+            name="CognitoJwtAuthorizer",
+            authorizer_type="JWT",
+            identity_source=["$request.header.Authorization"],
+            jwt_configuration=apigw.CfnAuthorizer.JWTConfigurationProperty(
+                issuer=f"https://cognito-idp.ap-south-1.amazonaws.com/ap-south-1_M3xBYcen7",
+                audience=["5592g38cjskmpd9ceid24osugm"],
+            ),
         )
  
         # ---------------------------------------------------------
-        # EC2 HTTP Integration
+        # EC2 HTTP Integration (L1, shared by every route)
         # ---------------------------------------------------------
-        ec2_integration = integrations.HttpUrlIntegration(
+        ec2_integration = apigw.CfnIntegration(
+            self,
             "Ec2HttpIntegration",
-            url=f"http://{ec2_public_ip}",
-            method=apigw.HttpMethod.ANY,
+            api_id=http_api.http_api_id,
+            integration_type="HTTP_PROXY",
+            integration_method="ANY",
+            integration_uri=f"http://{ec2_public_ip}",
+            payload_format_version="1.0",
         )
+        integration_target = f"integrations/{ec2_integration.ref}"
  
         # ---------------------------------------------------------
         # Public Route (NO AUTH)
         # ---------------------------------------------------------
-        http_api.add_routes(
-            path="/health",
-            methods=[apigw.HttpMethod.GET],
-            integration=ec2_integration,
+        apigw.CfnRoute(
+            self,
+            "HealthRoute",
+            api_id=http_api.http_api_id,
+            route_key="GET /health",
+            target=integration_target,
+            authorization_type="NONE",
         )
  
         # ---------------------------------------------------------
         # Protected Routes (JWT REQUIRED)
         # ---------------------------------------------------------
-        protected_routes = [
-            "/auth/{proxy+}",
-            "/masters/{proxy+}",
-            "/jobs/{proxy+}",
-            "/attachments/{proxy+}",
-            "/reports/{proxy+}",
-        ]
- 
-        for route in protected_routes:
-            http_api.add_routes(
-                path=route,
-                methods=[apigw.HttpMethod.ANY],
-                integration=ec2_integration,
-                authorizer=jwt_authorizer,
+        # Plain CfnRoute resources: no L2 add_routes() helper
+        # constructs or per-route jsii round-trips during synth.
+        for index, route in enumerate(PROTECTED_ROUTES):
+            apigw.CfnRoute(
+                self,
+                f"ProtectedRoute{index}",
+                api_id=http_api.http_api_id,
+                route_key=f"ANY {route}",
+                target=integration_target,
+                authorization_type="JWT",
+                authorizer_id=jwt_authorizer.ref,
             )
  
         # ---------------------------------------------------------
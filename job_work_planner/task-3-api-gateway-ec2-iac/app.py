@@ -1,6 +1,6 @@
 import os
 import aws_cdk as cdk
-from ec2_stack import Ec2Stack
+from ec2_stack import Ec2Stack, EC2_PUBLIC_IP_PARAMETER
 from api_gateway_stack import ApiGatewayStack
  
 app = cdk.App()
@@ -19,10 +19,13 @@ ec2_stack = Ec2Stack(
 )
  
 # API Gateway
+# Reads the EC2 IP from SSM (no cross-stack reference), so it can be
+# synthesized on its own; the explicit dependency only orders deploys
+# so /jobwork/ec2/ip exists before this stack resolves it.
 api_gateway_stack = ApiGatewayStack(
     app,
     "ApiGatewayStack",
-    ec2_public_ip=ec2_stack.ec2_public_ip,
+    ec2_ip_parameter_name=EC2_PUBLIC_IP_PARAMETER,
     env=env
 )
  
@@ -1,10 +1,31 @@
+import os
+ 
 from aws_cdk import (
     Stack,
     CfnOutput,
     aws_ec2 as ec2,
+    aws_ssm as ssm,
 )
 from constructs import Construct
  
+# SSM parameter holding the backend public IP (read by ApiGatewayStack)
+EC2_PUBLIC_IP_PARAMETER = "/jobwork/ec2/ip"
+ 
+ 
+def _required_setting(scope: Construct, context_key: str, env_var: str) -> str:
+    """
+    Reads a setting from cdk.json context, falling back to an env var.
+    Fails with a message naming both when neither is set.
+    """
+    value = scope.node.try_get_context(context_key) or os.environ.get(env_var)
+    if not value:
+        raise ValueError(
+            f"Missing {context_key}: set it in cdk.json context "
+            f"(\"{context_key}\") or export {env_var}"
+        )
+    # Context may hold a JSON list instead of a comma-separated string
+    return ",".join(value) if isinstance(value, list) else value
+ 
  
 class Ec2Stack(Stack):
     """
@@ -16,10 +37,30 @@ class Ec2Stack(Stack):
         super().__init__(scope, construct_id, **kwargs)
  
         # Use default VPC (simple & safe for early stage)
-        vpc = ec2.Vpc.from_lookup(
+        # Imported by ID (cdk.json context or env) rather than looked up,
+        # so synth never needs the context-provider round-trip.
+        vpc_id = _required_setting(self, "defaultVpcId", "JOBWORK_DEFAULT_VPC_ID")
+        subnet_ids = _required_setting(
+            self, "defaultSubnetIds", "JOBWORK_DEFAULT_SUBNET_IDS"
+        ).split(",")
+        # Concrete AZs (one per subnet, same order): ec2.Instance reads the
+        # chosen subnet's AZ as a plain string, which a Fn.get_azs token breaks
+        availability_zones = _required_setting(
+            self, "defaultAvailabilityZones", "JOBWORK_DEFAULT_AZS"
+        ).split(",")
+        if len(availability_zones) != len(subnet_ids):
+            raise ValueError(
+                "defaultAvailabilityZones / JOBWORK_DEFAULT_AZS must list one AZ "
+                "per subnet in defaultSubnetIds / JOBWORK_DEFAULT_SUBNET_IDS, "
+                "in the same order"
+            )
+ 
+        vpc = ec2.Vpc.from_vpc_attributes(
             self,
             "DefaultVpc",
-            is_default=True,
+            vpc_id=vpc_id,
+            availability_zones=availability_zones,
+            public_subnet_ids=subnet_ids,
         )
  
         # Security Group: allow HTTP traffic
@@ -56,9 +97,16 @@ class Ec2Stack(Stack):
             "echo 'Hello from EC2 backend' > /var/www/html/index.html",
         )
  
-        # Export public IP for API Gateway
+        # Export public IP for API Gateway (via SSM, no cross-stack reference)
         self.ec2_public_ip = instance.instance_public_ip
  
+        ssm.StringParameter(
+            self,
+            "Ec2PublicIpParameter",
+            parameter_name=EC2_PUBLIC_IP_PARAMETER,
+            string_value=self.ec2_public_ip,
+        )
+ 
         CfnOutput(
             self,
             "Ec2PublicIp",
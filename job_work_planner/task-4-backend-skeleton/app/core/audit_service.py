@@ -1,6 +1,9 @@
 # app/core/audit_service.py
 
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timezone
+import sys
+import time
 import uuid
 import logging
 
@@ -9,23 +12,73 @@ logger = logging.getLogger("jobwork-backend")
 # ---------------------------------------------------------
 # MOCK DATABASE (Append-Only for Immutability)
 # ---------------------------------------------------------
-# List of dicts representing audit records
-AUDIT_LOGS_TABLE = []
+# Columnar layout (one list per field, row N = index N in every list)
+# instead of one dict per record: far less per-row object overhead.
+AUDIT_COLUMNS = (
+    "audit_id",
+    "tenant_id",
+    "entity_type",
+    "entity_id",
+    "action",
+    "before",
+    "after",
+    "user_id",
+    "timestamp_ns",
+)
+AUDIT_LOGS_TABLE: dict[str, list] = {column: [] for column in AUDIT_COLUMNS}
 
-def log_audit_event(
+# Columns exposed in API responses (timestamp_ns is storage-only)
+_PUBLIC_COLUMNS = tuple(column for column in AUDIT_COLUMNS if column != "timestamp_ns")
+
+# Secondary index: (tenant_id, entity_type, entity_id) -> row numbers (oldest first)
+# Populated on write so trail reads never scan AUDIT_LOGS_TABLE.
+_TRAIL_INDEX: dict[tuple[str, str, str], list[int]] = defaultdict(list)
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """
+    Formats an epoch-ns timestamp as a naive UTC ISO string
+    (same shape as datetime.utcnow().isoformat()).
+    """
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    dt = datetime.fromtimestamp(seconds, tz=timezone.utc)
+    return dt.replace(tzinfo=None, microsecond=nanos // 1000).isoformat()
+
+
+def _public_record(record: dict) -> dict:
+    """
+    API-facing shape of a stored record: the internal timestamp_ns
+    column is replaced by the formatted `timestamp`.
+    """
+    public = {column: record[column] for column in _PUBLIC_COLUMNS}
+    public["timestamp"] = _format_timestamp(record["timestamp_ns"])
+    return public
+
+
+def _materialize_row(row: int) -> dict:
+    """
+    Builds the API-facing dict for one audit row.
+    """
+    return _public_record(
+        {column: AUDIT_LOGS_TABLE[column][row] for column in AUDIT_COLUMNS}
+    )
+
+
+def _build_audit_record(
     tenant_id: str,
-    entity_type: str,  # 'JOB' or 'JOB_OPERATION'
+    entity_type: str,
     entity_id: str,
-    action: str,       # e.g., 'CREATED', 'STATUS_CHANGED', 'PLANNED'
+    action: str,
     user_id: str,
-    before: dict | None = None,
-    after: dict | None = None,
+    before: dict | None,
+    after: dict | None,
 ) -> dict:
-    """
-    Writes an immutable audit record.
-    """
-    audit_record = {
-        "audit_id": str(uuid.uuid4()),
+    # Small closed vocabularies: intern so every row shares one str object
+    entity_type = sys.intern(entity_type)
+    action = sys.intern(action)
+
+    return {
+        "audit_id": uuid.uuid4().hex,
         "tenant_id": tenant_id,
         "entity_type": entity_type,
         "entity_id": entity_id,
@@ -33,29 +86,90 @@ def log_audit_event(
         "before": before or {},
         "after": after or {},
         "user_id": user_id,
-        "timestamp": datetime.utcnow().isoformat()
+        # Raw int on write; formatted lazily when the trail is read
+        "timestamp_ns": time.time_ns(),
     }
-    
-    # Append-only (Immutability enforced by lack of UPDATE/DELETE methods)
-    AUDIT_LOGS_TABLE.append(audit_record)
+
+
+def _append_audit_records(records: list[dict]) -> None:
+    """
+    Appends records to every column and the trail index.
+    Append-only (Immutability enforced by lack of UPDATE/DELETE methods)
+    """
+    first_row = len(AUDIT_LOGS_TABLE["audit_id"])
+    for column in AUDIT_COLUMNS:
+        AUDIT_LOGS_TABLE[column].extend(record[column] for record in records)
+
+    for row, record in enumerate(records, start=first_row):
+        key = (record["tenant_id"], record["entity_type"], record["entity_id"])
+        _TRAIL_INDEX[key].append(row)
+
+
+def log_audit_event(
+    tenant_id: str,
+    entity_type: str,  # 'JOB' or 'JOB_OPERATION'
+    entity_id: str,
+    action: str,       # e.g., 'CREATED', 'STATUS_CHANGED', 'PLANNED'
+    user_id: str,
+    before: dict | None = None,
+    after: dict | None = None,
+) -> dict:
+    """
+    Writes an immutable audit record.
+    """
+    audit_record = _build_audit_record(
+        tenant_id, entity_type, entity_id, action, user_id, before, after
+    )
+    _append_audit_records([audit_record])
     
     # Also dump to stdout/logger for infrastructure logging (CloudWatch/Datadog)
-    logger.info(f"AUDIT | {entity_type} | {action} | User: {user_id}")
+    logger.info(
+        "AUDIT | %s | %s | User: %s",
+        audit_record["entity_type"], audit_record["action"], user_id,
+    )
     
-    return audit_record
+    return _public_record(audit_record)
 
 
-def get_audit_trail(tenant_id: str, entity_type: str, entity_id: str) -> list:
+def log_audit_events_bulk(events: list[dict]) -> list[dict]:
+    """
+    Writes several immutable audit records in one step.
+    Each event takes the same keyword arguments as log_audit_event.
+    One column extend per field and one log line for the whole batch.
+    """
+    records = [_build_audit_record(
+        event["tenant_id"],
+        event["entity_type"],
+        event["entity_id"],
+        event["action"],
+        event["user_id"],
+        event.get("before"),
+        event.get("after"),
+    ) for event in events]
+
+    if records:
+        _append_audit_records(records)
+        logger.info("AUDIT_BATCH | %d events", len(records))
+
+    return [_public_record(record) for record in records]
+
+
+def get_audit_trail(
+    tenant_id: str,
+    entity_type: str,
+    entity_id: str,
+    limit: int | None = None,
+) -> list:
     """
     Retrieves the audit trail, strictly enforcing tenant isolation.
+    If limit is given, only the newest `limit` entries are returned.
     """
-    trail = [
-        entry for entry in AUDIT_LOGS_TABLE
-        if entry["tenant_id"] == tenant_id
-        and entry["entity_type"] == entity_type
-        and entry["entity_id"] == entity_id
-    ]
-    
-    # Sort descending (newest first)
-    trail.sort(key=lambda x: x["timestamp"], reverse=True)
-    return trail
\ No newline at end of file
+    rows = _TRAIL_INDEX.get((tenant_id, entity_type, entity_id), [])
+
+    # Rows are appended in time order, so the newest N are the tail
+    # of the list (no sort / heap needed)
+    if limit is not None:
+        rows = rows[-limit:] if limit > 0 else []
+
+    # Only matching rows are materialized into dicts
+    return [_materialize_row(row) for row in reversed(rows)]
\ No newline at end of file
@@ -7,59 +7,116 @@ Responsibilities:
 - Allow /health without authentication
 - Require Authorization header for all other routes
 - Attach user + tenant context to request.state
-- MUST return Response objects (not raise HTTPException)
+- MUST send Response objects (not raise HTTPException)
+
+Implemented as a pure ASGI middleware (no BaseHTTPMiddleware), so
+requests are not wrapped in extra Request/Response/stream objects.
 """
 
-from fastapi import Request
+import hmac
+from types import MappingProxyType
+
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.status import HTTP_401_UNAUTHORIZED
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+def _prebuild_401(detail: str) -> tuple[dict, dict]:
+    """
+    Serializes a 401 JSON response once and returns its two ASGI
+    messages (http.response.start, http.response.body) for reuse.
+    """
+    prototype = JSONResponse(
+        status_code=HTTP_401_UNAUTHORIZED,
+        content={"detail": detail},
+    )
+    start = {
+        "type": "http.response.start",
+        "status": prototype.status_code,
+        "headers": prototype.raw_headers,
+    }
+    body = {"type": "http.response.body", "body": prototype.body}
+    return start, body
+
+
+# MOCK token (Cognito later), pre-encoded for constant-time compare
+_MOCK_TOKEN = b"test123"
+
+# MOCK user context: one shared read-only mapping instead of a new
+# dict per request. Swap to a per-request dict once Cognito claims land.
+_MOCK_USER = MappingProxyType({
+    "user_id": "mock-user-id",
+    "email": "mock.user@jobwork.com",
+    "tenant_id": "tenant-1",
+    "role": "OWNER",
+})
 
+# Built at import time; rejected requests only replay cached bytes
+_401_HEADER_MISSING = _prebuild_401("Authorization header missing")
+_401_INVALID_FORMAT = _prebuild_401("Invalid Authorization header format")
+_401_INVALID_TOKEN = _prebuild_401("Invalid or expired token")
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+
+async def _send_401(send: Send, response: tuple[dict, dict]) -> None:
+    start, body = response
+    await send(start)
+    await send(body)
+
+
+class JWTAuthMiddleware:
+    # Allow documentation and health checks to bypass auth
+    _PUBLIC_PATHS: frozenset[str] = frozenset({
+        "/health",
+        "/docs",
+        "/openapi.json",
+        "/redoc",
+    })
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Middleware entry point.
 
         IMPORTANT:
         - Do NOT raise HTTPException here
-        - Always return a Response
+        - Always send a Response
         """
 
-        
-        
+        # Lifespan / websocket traffic is not authenticated here
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # -------------------------------------------------
         # 1. Public endpoints (no auth)
         # -------------------------------------------------
-        # Allow documentation and health checks to bypass auth
-        public_paths = {
-            "/health", 
-            "/docs", 
-            "/openapi.json", 
-            "/redoc"
-        }
-        
-        if request.url.path in public_paths:
-            return await call_next(request)
+        if scope["path"] in self._PUBLIC_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         # -------------------------------------------------
         # 2. Read Authorization header
         # -------------------------------------------------
-        auth_header = request.headers.get("Authorization")
+        # Raw ASGI headers: (lowercased name, value) byte pairs.
+        # Stay in bytes; no per-request Headers object or utf-8 decode.
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+                break
 
         if not auth_header:
-            return JSONResponse(
-                status_code=HTTP_401_UNAUTHORIZED,
-                content={"detail": "Authorization header missing"},
-            )
+            await _send_401(send, _401_HEADER_MISSING)
+            return
 
-        if not auth_header.startswith("Bearer "):
-            return JSONResponse(
-                status_code=HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid Authorization header format"},
-            )
+        if not auth_header.startswith(b"Bearer "):
+            await _send_401(send, _401_INVALID_FORMAT)
+            return
 
-        token = auth_header.replace("Bearer ", "")
+        # Strip only the known prefix (len("Bearer ") == 7)
+        token = auth_header[7:]
 
         # -------------------------------------------------
         # 3. MOCK JWT validation (Cognito later)
@@ -70,23 +127,17 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
         # - Validate exp, iss, aud
         # -------------------------------------------------
 
-        if token != "test123":
-            return JSONResponse(
-                status_code=HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid or expired token"},
-            )
+        if not hmac.compare_digest(token, _MOCK_TOKEN):
+            await _send_401(send, _401_INVALID_TOKEN)
+            return
 
         # -------------------------------------------------
         # 4. Attach user context (CRITICAL)
         # -------------------------------------------------
-        request.state.user = {
-            "user_id": "mock-user-id",
-            "email": "mock.user@jobwork.com",
-            "tenant_id": "tenant-1",
-            "role": "OWNER",
-        }
+        # request.state is backed by scope["state"]
+        scope.setdefault("state", {})["user"] = _MOCK_USER
 
         # -------------------------------------------------
         # 5. Continue request
         # -------------------------------------------------
-        return await call_next(request)     
\ No newline at end of file
+        await self.app(scope, receive, send)
@@ -17,19 +17,35 @@ Responsibilities:
 - Update parent job status automatically
 """
 
+from bisect import bisect_right, insort
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict
 import logging
-from app.core.audit_service import log_audit_event
+import sys
+import threading
+from app.core.audit_service import log_audit_event, log_audit_events_bulk
+from app.core.logger import enqueue_log_event
 from app.core.notification_service import create_notification
+from app.core.request_clock import now_iso
 from app.db.mock_db import (
-    MACHINES_TABLE,
-    SHIFTS_TABLE,
+    MACHINES_BY_TENANT,
+    SHIFTS_BY_TENANT,
+    NO_RECORDS,
     PARTS_TABLE,
     OPERATIONS_TABLE,
+    JOBS_TABLE,
     JOB_OPERATIONS_TABLE,
     JOB_OPERATION_PRODUCTION_TABLE,
-    JOB_OPERATION_RESCHEDULE_TABLE
+    JOB_OPERATION_RESCHEDULE_TABLE,
+    JOB_TO_OP_IDS,
+    JOB_SEQ_INDEX,
+    JOB_STATUS_COUNTS,
+    OPS_BY_TENANT,
+    OPS_BY_TENANT_STATUS,
+    MACHINE_SCHEDULE,
+    JobOperation,
 )
 
 logger = logging.getLogger("jobwork-backend")
@@ -42,17 +58,64 @@ class CapacityConflictError(Exception):
         self.clashes = clashes
         super().__init__(self.message)
 
+# Per-job write locks: status mutations and the parent rollup for
+# one job are serialized (sync routes run in a threadpool). A fixed
+# stripe array keyed by hash(job_id), so memory stays bounded however
+# many jobs pass through; unrelated jobs may share a stripe, which only
+# costs contention. Never hold two stripes at once. With DynamoDB this
+# becomes a conditional write on the expected status.
+_JOB_LOCK_STRIPES: tuple[threading.Lock, ...] = tuple(
+    threading.Lock() for _ in range(64)
+)
+
+def _job_lock(job_id: str) -> threading.Lock:
+    return _JOB_LOCK_STRIPES[hash(job_id) % len(_JOB_LOCK_STRIPES)]
+
 # Configurable capacity rule (MVP)
 MAX_OPS_PER_SHIFT = 3
 
+def _scan_machine_shift(
+    machine_id: str,
+    shift_id: str,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    exclude_id: str | None = None,
+) -> List[Dict]:
+    """
+    Returns the ops planned on a machine & shift, optionally only those
+    overlapping [start_date, end_date]. Shared by the capacity check and
+    the planning conflict check.
+    """
+    # Only this machine & shift's intervals, sorted by start. Anything
+    # starting after end_date cannot overlap, so bisect cuts it off.
+    schedule = MACHINE_SCHEDULE.get((machine_id, shift_id), [])
+    if end_date is not None:
+        schedule = schedule[:bisect_right(schedule, end_date, key=itemgetter(0))]
+
+    clashes = []
+    for _, other_end, other_id in schedule:
+        if other_id == exclude_id:
+            continue # Skip self
+
+        # Check for date overlap (start side; end side handled by bisect)
+        if start_date is not None and other_end < start_date:
+            continue
+
+        other_op = JOB_OPERATIONS_TABLE[other_id]
+        clashes.append({
+            "job_operation_id": other_id,
+            "job_id": other_op.job_id,
+            "status": other_op.status
+        })
+
+    return clashes
+
+
 def check_capacity_conflicts(machine_id: str, shift_id: str) -> None:
     """
     Checks for capacity conflicts for a given machine and shift.
     """
-    current_operations = [
-        op for op in JOB_OPERATIONS_TABLE.values()
-        if op["machine_id"] == machine_id and op["shift_id"] == shift_id
-    ]
+    current_operations = _scan_machine_shift(machine_id, shift_id)
 
     if len(current_operations) >= MAX_OPS_PER_SHIFT:
         clashes = [op["job_operation_id"] for op in current_operations]
@@ -62,34 +125,56 @@ def check_capacity_conflicts(machine_id: str, shift_id: str) -> None:
         )
 
 
-
-
+def _get_tenant_job_op(job_operation_id: str, tenant_id: str) -> JobOperation:
+    """
+    Fetches a job operation owned by tenant_id (STRICT TENANT CHECK).
+    """
+    job_op = JOB_OPERATIONS_TABLE.get(job_operation_id)
+    if job_op is None:
+        raise ValueError("Job operation not found")
+    if job_op.tenant_id != tenant_id:
+        raise ValueError("Unauthorized access to job operation")
+    return job_op
 
 
 # -------------------------------------------------------
 # STEP 1: Route Validation
 # -------------------------------------------------------
 
-def validate_part_route(part_id: str, tenant_id: str) -> List[str]:
+@lru_cache(maxsize=1024)
+def validate_part_route(part_id: str, tenant_id: str) -> tuple[str, ...]:
     """
     Validates Part default operation route.
+
+    Memoized per (part_id, tenant_id): parts and operations are reference
+    data, so bursts of jobs for the same part validate once. Failures
+    are not cached. Call on_parts_changed() after reloading either table.
     """
     part = PARTS_TABLE.get(part_id)
     if not part:
         raise ValueError("Part does not exist")
 
-    if part["tenant_id"] != tenant_id:
+    if part.tenant_id != tenant_id:
         raise ValueError("Part does not belong to tenant")
 
-    route = part.get("default_operations_route")
+    route = part.default_operations_route
     if not route:
         raise ValueError("Part has no operation route defined")
 
-    for op_id in route:
-        if op_id not in OPERATIONS_TABLE:
-            raise ValueError(f"Invalid operation in route: {op_id}")
+    # One C-level set difference instead of a Python loop
+    missing = set(route).difference(OPERATIONS_TABLE)
+    if missing:
+        raise ValueError(f"Invalid operation in route: {', '.join(sorted(missing))}")
 
-    return route
+    return tuple(route)
+
+
+def on_parts_changed() -> None:
+    """
+    Drops memoized route validations after PARTS_TABLE or
+    OPERATIONS_TABLE is reloaded (both are read-only at runtime).
+    """
+    validate_part_route.cache_clear()
 
 
 # -------------------------------------------------------
@@ -99,54 +184,75 @@ def validate_part_route(part_id: str, tenant_id: str) -> List[str]:
 def create_job_operations(job_id: str, part_id: str, tenant_id: str) -> List[Dict]:
     """
     Creates job operations from part route.
-    """
-    created_operation_ids = []
-
-    try:
-        route = validate_part_route(part_id, tenant_id)
-
-        for index, op_id in enumerate(route):
-            job_operation_id = f"{job_id}-{op_id}"
-
-            job_operation = {
-              "job_operation_id": job_operation_id,
-              "job_id": job_id,
-              "tenant_id": tenant_id,
-              "operation_id": op_id,
-              "sequence_number": index + 1,
-              "status": "READY" if index == 0 else "NOT_STARTED",
-            }
-
-            JOB_OPERATIONS_TABLE[job_operation_id] = job_operation
-            created_operation_ids.append(job_operation_id)
 
-        logger.info(
+    All records are staged locally first and committed to the table
+    and its indexes in one step, so a failure leaves nothing behind
+    (no rollback needed).
+    """
+    # O(1) guard: never overwrite an existing job's operations
+    if job_id in JOB_TO_OP_IDS:
+        raise ValueError(f"Operations already exist for job {job_id}")
+
+    route = validate_part_route(part_id, tenant_id)
+
+    # -----------------------------------------------
+    # Stage (no shared state touched yet)
+    # -----------------------------------------------
+    new_records: Dict[str, JobOperation] = {}
+    status_counts: Dict[str, int] = {}
+
+    for index, op_id in enumerate(route):
+        job_operation_id = f"{job_id}-{op_id}"
+        status = "READY" if index == 0 else "NOT_STARTED"
+
+        new_records[job_operation_id] = JobOperation(
+            job_operation_id=job_operation_id,
+            job_id=job_id,
+            tenant_id=tenant_id,
+            operation_id=op_id,
+            sequence_number=index + 1,
+            status=status,
+        )
+        status_counts[status] = status_counts.get(status, 0) + 1
+
+    created_operation_ids = list(new_records)
+
+    # -----------------------------------------------
+    # Commit (single point of mutation)
+    # -----------------------------------------------
+    JOB_OPERATIONS_TABLE.update(new_records)
+    JOB_TO_OP_IDS[job_id] = created_operation_ids
+    JOB_SEQ_INDEX.update(
+        ((job_id, seq), op_id)
+        for seq, op_id in enumerate(created_operation_ids, start=1)
+    )
+    JOB_STATUS_COUNTS[job_id] = status_counts
+    OPS_BY_TENANT.setdefault(tenant_id, {}).update(new_records)
+    for job_operation_id, record in new_records.items():
+        OPS_BY_TENANT_STATUS.setdefault(
+            (tenant_id, record.status), {}
+        )[job_operation_id] = record
+
+    if logger.isEnabledFor(logging.INFO):
+        enqueue_log_event(
             "JOB_ROUTE_CREATED",
-            extra={"job_id": job_id, "tenant_id": tenant_id},
+            {"job_id": job_id, "tenant_id": tenant_id},
         )
 
-        return created_operation_ids
-
-    except Exception as exc:
-        # ROLLBACK
-        for op_id in created_operation_ids:
-            JOB_OPERATIONS_TABLE.pop(op_id, None)
-        raise exc
+    return created_operation_ids
 
 
 # -------------------------------------------------------
 # STEP 3: Read Operations for a Job
 # -------------------------------------------------------
 
-def get_job_operations(job_id: str) -> List[Dict]:
+def get_job_operations(job_id: str) -> List[JobOperation]:
     """
     Returns job operations ordered by sequence_number.
     """
-    operations = [
-        op for op in JOB_OPERATIONS_TABLE.values()
-        if op["job_id"] == job_id
-    ]
-    return sorted(operations, key=lambda x: x["sequence_number"])
+    # JOB_TO_OP_IDS is written in route order (sequence_number = index + 1),
+    # so the index order is already the sequence order; no sort needed.
+    return [JOB_OPERATIONS_TABLE[op_id] for op_id in JOB_TO_OP_IDS.get(job_id, ())]
 
 
 # -------------------------------------------------------
@@ -165,29 +271,170 @@ OP_STATUS_CANCELLED = "CANCELLED"
 # SCRUM 28/31: Allowed Status Transitions (State Machine)
 # -------------------------------------------------------
 
+# Terminal states share one immutable empty set
+_NO_TRANSITIONS: frozenset = frozenset()
+
 ALLOWED_STATUS_TRANSITIONS = {
-    OP_STATUS_NOT_STARTED: {OP_STATUS_IN_PROGRESS, OP_STATUS_CANCELLED},
-    OP_STATUS_READY: {OP_STATUS_IN_PROGRESS},
-    OP_STATUS_IN_PROGRESS: {OP_STATUS_COMPLETED, OP_STATUS_PAUSED}, # <--- Can Pause or Complete
-    OP_STATUS_PAUSED: {OP_STATUS_IN_PROGRESS},                       # <--- Can Resume
-    OP_STATUS_COMPLETED: set(),
-    OP_STATUS_CANCELLED: set(),
+    OP_STATUS_NOT_STARTED: frozenset({OP_STATUS_IN_PROGRESS, OP_STATUS_CANCELLED}),
+    OP_STATUS_READY: frozenset({OP_STATUS_IN_PROGRESS}),
+    OP_STATUS_IN_PROGRESS: frozenset({OP_STATUS_COMPLETED, OP_STATUS_PAUSED}), # <--- Can Pause or Complete
+    OP_STATUS_PAUSED: frozenset({OP_STATUS_IN_PROGRESS}),                       # <--- Can Resume
+    OP_STATUS_COMPLETED: _NO_TRANSITIONS,
+    OP_STATUS_CANCELLED: _NO_TRANSITIONS,
 }
 
+# Compiled form of the table above: one bit per status, one mask of
+# allowed targets per source status. Derived, so the dict stays the
+# single source of truth.
+_STATUS_BIT = {
+    status: 1 << bit for bit, status in enumerate(ALLOWED_STATUS_TRANSITIONS)
+}
+_TRANSITION_MASK = {
+    current: sum(_STATUS_BIT[target] for target in targets)
+    for current, targets in ALLOWED_STATUS_TRANSITIONS.items()
+}
+
+def _set_op_status(job_op: JobOperation, new_status: str) -> None:
+    """
+    Sets an operation's status and keeps the per-job status
+    counters (JOB_STATUS_COUNTS) and the (tenant, status) index
+    (OPS_BY_TENANT_STATUS) in sync.
+    """
+    counts = JOB_STATUS_COUNTS.setdefault(job_op.job_id, {})
+    old_status = job_op.status
+    counts[old_status] = counts.get(old_status, 0) - 1
+    counts[new_status] = counts.get(new_status, 0) + 1
+
+    op_id = job_op.job_operation_id
+    tenant_id = job_op.tenant_id
+    OPS_BY_TENANT_STATUS.get((tenant_id, old_status), {}).pop(op_id, None)
+    OPS_BY_TENANT_STATUS.setdefault((tenant_id, new_status), {})[op_id] = job_op
+
+    job_op.status = new_status
+
+
 def is_valid_status_transition(current_status: str, new_status: str) -> bool:
     """
     Validates whether a status change is allowed
     based on the defined state machine.
     """
-    allowed = ALLOWED_STATUS_TRANSITIONS.get(current_status, set())
-    return new_status in allowed
+    return bool(
+        _TRANSITION_MASK.get(current_status, 0) & _STATUS_BIT.get(new_status, 0)
+    )
+
+
+# -------------------------------------------------------
+# SCRUM 28/31: Transition Validators
+# -------------------------------------------------------
+# Each runs only the checks its transition needs and returns the
+# (possibly normalized) quantity_rejected.
+
+def _check_previous_completed(job_op: JobOperation, override_sequence: bool) -> None:
+    if override_sequence or job_op.sequence_number <= 1:
+        return
+    prev_id = JOB_SEQ_INDEX.get((job_op.job_id, job_op.sequence_number - 1))
+    prev_op = JOB_OPERATIONS_TABLE.get(prev_id) if prev_id else None
+    if not prev_op or prev_op.status != OP_STATUS_COMPLETED:
+        raise ValueError("Previous operation must be COMPLETED first")
+
+
+def _validate_start(job_op, quantity_completed, quantity_rejected, rework_flag, rework_note, override_sequence):
+    # Planning prerequisite
+    if not job_op.machine_id:
+        raise ValueError("Cannot start operation: Machine not assigned (Planning required)")
+
+    # Sequence enforcement
+    _check_previous_completed(job_op, override_sequence)
+    return quantity_rejected
+
+
+def _validate_resume(job_op, quantity_completed, quantity_rejected, rework_flag, rework_note, override_sequence):
+    # Sequence enforcement (already planned when first started)
+    _check_previous_completed(job_op, override_sequence)
+    return quantity_rejected
+
+
+def _validate_complete(job_op, quantity_completed, quantity_rejected, rework_flag, rework_note, override_sequence):
+    if quantity_completed is None:
+        raise ValueError("quantity_completed is required when completing an operation")
+
+    if quantity_completed < 0:
+        raise ValueError("quantity_completed cannot be negative")
+
+    quantity_rejected = quantity_rejected or 0
+    if quantity_rejected < 0:
+        raise ValueError("quantity_rejected cannot be negative")
+
+    # 👇 NEW: REAL JOB QUANTITY ENFORCEMENT
+    parent_job = JOBS_TABLE.get(job_op.job_id)
+    if not parent_job:
+        raise ValueError("Parent job not found")
+
+    job_qty = parent_job["quantity"]
+
+    if quantity_completed > job_qty:
+        raise ValueError(f"quantity_completed ({quantity_completed}) exceeds total job quantity ({job_qty})")
+
+    if (quantity_completed + quantity_rejected) > job_qty:
+        raise ValueError(f"Total produced + rejected exceeds job quantity ({job_qty})")
+
+    # 🔁 Rework validation
+    if rework_flag and not rework_note:
+        raise ValueError("rework_note is required when rework_flag is true")
+
+    return quantity_rejected
+
+
+# (current_status, new_status) -> validator
+TRANSITION_VALIDATORS = {
+    (OP_STATUS_NOT_STARTED, OP_STATUS_IN_PROGRESS): _validate_start,
+    (OP_STATUS_READY, OP_STATUS_IN_PROGRESS): _validate_start,
+    (OP_STATUS_PAUSED, OP_STATUS_IN_PROGRESS): _validate_resume,
+    (OP_STATUS_IN_PROGRESS, OP_STATUS_COMPLETED): _validate_complete,
+}
+
+
+# -------------------------------------------------------
+# SCRUM 31: Execution Timestamp Handlers
+# -------------------------------------------------------
+
+def _on_start(job_op, user_id, now, quantity_completed, quantity_rejected):
+    job_op.actual_start_time = now
+    job_op.started_by = user_id
+
+
+def _on_pause(job_op, user_id, now, quantity_completed, quantity_rejected):
+    job_op.paused_at = now
+    job_op.paused_by = user_id
+
+
+def _on_resume(job_op, user_id, now, quantity_completed, quantity_rejected):
+    job_op.resumed_at = now
+    job_op.resumed_by = user_id
+
+
+def _on_complete(job_op, user_id, now, quantity_completed, quantity_rejected):
+    job_op.actual_end_time = now
+    job_op.completed_by = user_id
+    job_op.quantity_completed = quantity_completed
+    job_op.quantity_rejected = quantity_rejected
+
+
+# (current_status, new_status) -> timestamp handler
+TRANSITION_HANDLERS = {
+    (OP_STATUS_NOT_STARTED, OP_STATUS_IN_PROGRESS): _on_start,
+    (OP_STATUS_READY, OP_STATUS_IN_PROGRESS): _on_start,
+    (OP_STATUS_IN_PROGRESS, OP_STATUS_PAUSED): _on_pause,
+    (OP_STATUS_PAUSED, OP_STATUS_IN_PROGRESS): _on_resume,
+    (OP_STATUS_IN_PROGRESS, OP_STATUS_COMPLETED): _on_complete,
+}
 
 
 # -------------------------------------------------------
 # SCRUM 28/31: Update Job Operation Status (Service Logic)
 # -------------------------------------------------------
 
-def update_job_operation_status(
+def _apply_status_update(
     job_operation_id: str,
     new_status: str,
     *,
@@ -198,18 +445,27 @@ def update_job_operation_status(
     rework_flag: bool = False,
     rework_note: str | None = None,
     override_sequence: bool = False,
-):
+) -> tuple[JobOperation, str, int | None, str | None]:
+    """
+    Validates and applies one status change (steps 1-8).
+
+    Parent job rollup, logging and audit are left to the caller so
+    single and batch updates can run them once per call.
+    Returns (job_op, previous status, quantity_rejected, timestamp);
+    timestamp is None when the op was already in new_status (no-op).
+    """
     # 1️⃣ Fetch operation
-    job_op = JOB_OPERATIONS_TABLE.get(job_operation_id)
-    if not job_op:
-        raise ValueError("Job operation not found")
+    job_op = _get_tenant_job_op(job_operation_id, tenant_id)
 
-    # 👇 NEW: STRICT TENANT CHECK
-    if job_op.get("tenant_id") != tenant_id:
-        raise ValueError("Unauthorized access to job operation")
-  
-    current_status = job_op["status"]
-    # ..............
+    # Read the fields used below once, up front
+    current_status = job_op.status
+    job_id = job_op.job_id
+    sequence_number = job_op.sequence_number
+
+    # Idempotent retry: already in the requested status, nothing to
+    # validate or write
+    if new_status == current_status:
+        return job_op, current_status, quantity_rejected, None
 
     # ---------------------------------------------------
     # 2️⃣ State machine validation
@@ -219,167 +475,152 @@ def update_job_operation_status(
             f"Invalid status transition: {current_status} → {new_status}"
         )
 
-    # ---------------------------------------------------
-    # 3️⃣ Planning prerequisite (for starting only)
-    # ---------------------------------------------------
-    if new_status == OP_STATUS_IN_PROGRESS and current_status != OP_STATUS_PAUSED:
-        if not job_op.get("machine_id"):
-            raise ValueError("Cannot start operation: Machine not assigned (Planning required)")
+    # Request strings are fresh objects; interning the (now known-valid)
+    # status means every stored status is the same object as its
+    # OP_STATUS_* constant, so later == checks hit the identity fast path
+    new_status = sys.intern(new_status)
 
     # ---------------------------------------------------
-    # 4️⃣ Sequence enforcement
+    # 3️⃣-5️⃣ Transition-specific checks
     # ---------------------------------------------------
-    if new_status == OP_STATUS_IN_PROGRESS and not override_sequence:
-        if job_op["sequence_number"] > 1:
-            prev_ops = [
-                op for op in JOB_OPERATIONS_TABLE.values()
-                if op["job_id"] == job_op["job_id"]
-                and op["sequence_number"] == job_op["sequence_number"] - 1
-            ]
-            if not prev_ops or prev_ops[0]["status"] != OP_STATUS_COMPLETED:
-                raise ValueError("Previous operation must be COMPLETED first")
+    # Planning / sequence / quantity rules, specialized per (from, to)
+    validator = TRANSITION_VALIDATORS.get((current_status, new_status))
+    if validator:
+        quantity_rejected = validator(
+            job_op,
+            quantity_completed,
+            quantity_rejected,
+            rework_flag,
+            rework_note,
+            override_sequence,
+        )
 
     # ---------------------------------------------------
-    # 5️⃣ Completion quantity validation
-    # ---------------------------------------------------
-    # ---------------------------------------------------
-    # STEP 4: Quantity & Completion Validations
+    # 6️⃣ Timestamp handling
     # ---------------------------------------------------
-    if new_status == OP_STATUS_COMPLETED:
+    # Computed once; reused for op timestamps and parent job updated_at
+    now = now_iso()
+    handler = TRANSITION_HANDLERS.get((current_status, new_status))
+    unblocked_op = None
+
+    # Everything above is read-only validation and runs lock-free.
+    # Only the mutation below holds the job's lock.
+    with _job_lock(job_id):
+        # Optimistic check: another request may have moved this op
+        # between validation and here
+        if job_op.status != current_status:
+            raise ValueError(
+                f"Job operation status changed to {job_op.status} concurrently; retry"
+            )
 
-        if quantity_completed is None:
-                raise ValueError("quantity_completed is required when completing an operation")
+        # Exactly one handler per (from, to) pair; CANCELLED has none
+        if handler:
+            handler(job_op, user_id, now, quantity_completed, quantity_rejected)
+
+        # ---------------------------------------------------
+        # 7️⃣ Update status
+        # ---------------------------------------------------
+        _set_op_status(job_op, new_status)
+
+        # ---------------------------------------------------
+        # 8️⃣ SCRUM 33 – Auto-Advance Workflow
+        # ---------------------------------------------------
+        if new_status == OP_STATUS_COMPLETED:
+
+            next_id = JOB_SEQ_INDEX.get((job_id, sequence_number + 1))
+            next_op = JOB_OPERATIONS_TABLE.get(next_id) if next_id else None
+
+            if next_op:
+
+                if next_op._planning_complete:
+                    _set_op_status(next_op, OP_STATUS_READY)
+                    unblocked_op = next_op
+                else:
+                    _set_op_status(next_op, OP_STATUS_NOT_STARTED)
+                    next_op.needs_planning = True
+
+    if unblocked_op:
+        # ========================================================
+        # 👇 NEW: NOTIFICATION TRIGGER (Operation unblocked!)
+        # ========================================================
+        create_notification(
+            tenant_id=tenant_id,
+            user_id=None, # Broadcasts to all Supervisors/Planners
+            notif_type="READY",
+            message=f"Operation {unblocked_op.operation_id} for Job {job_id} is READY to start.",
+            entity_ref=unblocked_op.job_operation_id
+        )
 
-        if quantity_completed < 0:
-                raise ValueError("quantity_completed cannot be negative")
+    return job_op, current_status, quantity_rejected, now
 
-        quantity_rejected = quantity_rejected or 0
-        if quantity_rejected < 0:
-                raise ValueError("quantity_rejected cannot be negative")
 
-            # 👇 NEW: REAL JOB QUANTITY ENFORCEMENT
-        from app.db.mock_db import JOBS_TABLE # Make sure to use the new mock_db!
-            
-        parent_job = JOBS_TABLE.get(job_op["job_id"])
-        if not parent_job:
-                raise ValueError("Parent job not found")
-                
-        job_qty = parent_job["quantity"]
+def _rollup_parent_job_status(job_id: str, now: str) -> None:
+    """
+    Updates the parent job's status from its per-job op status counters.
+    """
+    job = JOBS_TABLE.get(job_id)
 
-        if quantity_completed > job_qty:
-                raise ValueError(f"quantity_completed ({quantity_completed}) exceeds total job quantity ({job_qty})")
+    if job:
+        with _job_lock(job_id):
+            # O(1): decided from per-job status counters, no op iteration
+            counts = JOB_STATUS_COUNTS.get(job_id, {})
+            total_ops = len(JOB_TO_OP_IDS.get(job_id, ()))
 
-        if (quantity_completed + quantity_rejected) > job_qty:
-                raise ValueError(f"Total produced + rejected exceeds job quantity ({job_qty})")
+            if counts.get(OP_STATUS_COMPLETED, 0) == total_ops:
+                job["status"] = "COMPLETED"
+            elif counts.get(OP_STATUS_IN_PROGRESS, 0) > 0:
+                job["status"] = "IN_PROGRESS"
 
-            # 🔁 Rework validation
-        if rework_flag and not rework_note:
-                raise ValueError("rework_note is required when rework_flag is true")
+            job["updated_at"] = now
 
-    # ---------------------------------------------------
-    # 6️⃣ Timestamp handling
-    # ---------------------------------------------------
-    # 👇 Add this line right here!
-    now = datetime.utcnow().isoformat()
-
-    # ---------------------------------------------------
-    # 6️⃣ Timestamp handling
-    # ---------------------------------------------------
-    if new_status == OP_STATUS_IN_PROGRESS and current_status != OP_STATUS_PAUSED:
-        job_op["actual_start_time"] = now
-        job_op["started_by"] = user_id
-    if new_status == OP_STATUS_IN_PROGRESS and current_status != OP_STATUS_PAUSED:
-        job_op["actual_start_time"] = now
-        job_op["started_by"] = user_id
-
-    elif new_status == OP_STATUS_PAUSED:
-        job_op["paused_at"] = now
-        job_op["paused_by"] = user_id
-
-    elif new_status == OP_STATUS_IN_PROGRESS and current_status == OP_STATUS_PAUSED:
-        job_op["resumed_at"] = now
-        job_op["resumed_by"] = user_id
-
-    elif new_status == OP_STATUS_COMPLETED:
-        job_op["actual_end_time"] = now
-        job_op["completed_by"] = user_id
-        job_op["quantity_completed"] = quantity_completed
-        job_op["quantity_rejected"] = quantity_rejected
 
-    # ---------------------------------------------------
-    # 7️⃣ Update status
-    # ---------------------------------------------------
-    job_op["status"] = new_status
+def update_job_operation_status(
+    job_operation_id: str,
+    new_status: str,
+    *,
+    tenant_id: str,   # 👈 NEW: Require tenant_id
+    user_id: str,
+    quantity_completed: int | None = None,
+    quantity_rejected: int | None = None,
+    rework_flag: bool = False,
+    rework_note: str | None = None,
+    override_sequence: bool = False,
+):
+    job_op, current_status, quantity_rejected, now = _apply_status_update(
+        job_operation_id,
+        new_status,
+        tenant_id=tenant_id,
+        user_id=user_id,
+        quantity_completed=quantity_completed,
+        quantity_rejected=quantity_rejected,
+        rework_flag=rework_flag,
+        rework_note=rework_note,
+        override_sequence=override_sequence,
+    )
 
-    # ---------------------------------------------------
-    # 8️⃣ SCRUM 33 – Auto-Advance Workflow
-    # ---------------------------------------------------
-    if new_status == OP_STATUS_COMPLETED:
-
-        next_ops = [
-            op for op in JOB_OPERATIONS_TABLE.values()
-            if op["job_id"] == job_op["job_id"]
-            and op["sequence_number"] == job_op["sequence_number"] + 1
-        ]
-
-        if next_ops:
-            next_op = next_ops[0]
-
-            if (
-                next_op.get("machine_id")
-                and next_op.get("shift_id")
-                and next_op.get("planned_start_date")
-                and next_op.get("planned_end_date")
-            ):
-                next_op["status"] = OP_STATUS_READY
-                
-                # ========================================================
-                # 👇 NEW: NOTIFICATION TRIGGER (Operation unblocked!)
-                # ========================================================
-                create_notification(
-                    tenant_id=job_op["tenant_id"],
-                    user_id=None, # Broadcasts to all Supervisors/Planners
-                    notif_type="READY",
-                    message=f"Operation {next_op['operation_id']} for Job {job_op['job_id']} is READY to start.",
-                    entity_ref=next_op["job_operation_id"]
-                )
-                
-            else:
-                next_op["status"] = OP_STATUS_NOT_STARTED
-                next_op["needs_planning"] = True
+    # No-op retry: no rollup, log or audit record
+    if now is None:
+        return job_op
 
     # ---------------------------------------------------
     # 9️⃣ Parent Job Status Update
     # ---------------------------------------------------
-    from app.db.mock_db import JOBS_TABLE
-    job = JOBS_TABLE.get(job_op["job_id"])
-
-    if job:
-        all_ops = [
-            op for op in JOB_OPERATIONS_TABLE.values()
-            if op["job_id"] == job["job_id"]
-        ]
-
-        if all(op["status"] == OP_STATUS_COMPLETED for op in all_ops):
-            job["status"] = "COMPLETED"
-        elif any(op["status"] == OP_STATUS_IN_PROGRESS for op in all_ops):
-            job["status"] = "IN_PROGRESS"
-
-        job["updated_at"] = now
-
-    logger.info(
-        "OP_STATUS_CHANGED",
-        extra={
-            "job_operation_id": job_operation_id,
-            "old_status": current_status,
-            "new_status": new_status,
-            "user_id": user_id,
-        },
-    )
+    _rollup_parent_job_status(job_op.job_id, now)
+
+    if logger.isEnabledFor(logging.INFO):
+        enqueue_log_event(
+            "OP_STATUS_CHANGED",
+            {
+                "job_operation_id": job_operation_id,
+                "old_status": current_status,
+                "new_status": new_status,
+                "user_id": user_id,
+            },
+        )
 
     # WRITE TO THE AUDIT TRAIL 
     log_audit_event(
-        tenant_id=job_op["tenant_id"],
+        tenant_id=tenant_id,
         entity_type="JOB_OPERATION",
         entity_id=job_operation_id,
         action="STATUS_CHANGED",
@@ -395,6 +636,167 @@ def update_job_operation_status(
     return job_op
 
 
+def _finish_status_batch(
+    transitions_by_job: Dict[str, List[Dict]],
+    now: str | None,
+    *,
+    tenant_id: str,
+    user_id: str,
+) -> None:
+    """
+    Parent rollup and audit for the changes a batch has applied.
+    """
+    # One rollup per job, not per operation
+    for job_id in transitions_by_job:
+        _rollup_parent_job_status(job_id, now)
+
+    # Per-op records (same as a single update, so each op's audit trail
+    # is complete) plus one batch summary per job, in one bulk append
+    audit_events = [
+        {
+            "tenant_id": tenant_id,
+            "entity_type": "JOB_OPERATION",
+            "entity_id": transition["job_operation_id"],
+            "action": "STATUS_CHANGED",
+            "user_id": user_id,
+            "before": {"status": transition["old_status"]},
+            "after": {
+                "status": transition["new_status"],
+                "quantity_completed": transition["quantity_completed"],
+                "quantity_rejected": transition["quantity_rejected"],
+            },
+        }
+        for transitions in transitions_by_job.values()
+        for transition in transitions
+    ]
+    audit_events.extend(
+        {
+            "tenant_id": tenant_id,
+            "entity_type": "JOB",
+            "entity_id": job_id,
+            "action": "OP_BATCH_STATUS_CHANGED",
+            "user_id": user_id,
+            "after": {"transitions": transitions},
+        }
+        for job_id, transitions in transitions_by_job.items()
+    )
+    log_audit_events_bulk(audit_events)
+
+
+# Batch item field -> (accepted types, required)
+# bool is checked separately: it is an int subclass, so it would
+# otherwise pass as a quantity.
+_BATCH_ITEM_FIELDS = {
+    "job_operation_id": ((str,), True),
+    "status": ((str,), True),
+    "quantity_completed": ((int,), False),
+    "quantity_rejected": ((int,), False),
+    "rework_flag": ((bool,), False),
+    "rework_note": ((str,), False),
+    "override_sequence": ((bool,), False),
+}
+
+
+def _validate_batch_updates(updates) -> None:
+    """
+    Raises ValueError describing the first malformed item, so a bad
+    batch is rejected before any update is applied.
+    """
+    if not isinstance(updates, list) or not updates:
+        raise ValueError("updates must be a non-empty list")
+
+    for index, item in enumerate(updates):
+        if not isinstance(item, dict):
+            raise ValueError(f"updates[{index}] must be an object")
+
+        for field, (types, required) in _BATCH_ITEM_FIELDS.items():
+            value = item.get(field)
+            if value is None:
+                if required:
+                    raise ValueError(f"updates[{index}].{field} is required")
+                continue
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                raise ValueError(f"updates[{index}].{field} has an invalid type")
+
+
+def bulk_update_job_operation_status(
+    updates: List[Dict],
+    *,
+    tenant_id: str,
+    user_id: str,
+) -> Dict:
+    """
+    Applies several status updates in one call.
+
+    Updates run in order, so a batch may complete one operation and
+    start the next. A malformed batch (item shape or field types)
+    raises ValueError before anything is applied. Each item is then
+    validated like a single update; items that fail are returned in
+    `unprocessed` and do not stop the batch.
+    Parent job rollup runs once per touched job. Every applied change
+    gets the same JOB_OPERATION STATUS_CHANGED audit record as a single
+    update, plus one OP_BATCH_STATUS_CHANGED record per job; all of
+    them are written in one bulk append.
+    """
+    processed: List[JobOperation] = []
+    unprocessed: List[Dict] = []
+    transitions_by_job: Dict[str, List[Dict]] = {}
+    last_now = None
+
+    _validate_batch_updates(updates)
+
+    try:
+        for update in updates:
+            job_operation_id = update["job_operation_id"]
+            new_status = update["status"]
+
+            try:
+                job_op, old_status, quantity_rejected, now = _apply_status_update(
+                    job_operation_id,
+                    new_status,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    quantity_completed=update.get("quantity_completed"),
+                    quantity_rejected=update.get("quantity_rejected"),
+                    rework_flag=update.get("rework_flag", False),
+                    rework_note=update.get("rework_note"),
+                    override_sequence=update.get("override_sequence", False),
+                )
+            except ValueError as exc:
+                unprocessed.append({"job_operation_id": job_operation_id, "error": str(exc)})
+                continue
+
+            processed.append(job_op)
+            if now is None:
+                continue # No-op retry: nothing to roll up or audit
+            last_now = now
+
+            transitions_by_job.setdefault(job_op.job_id, []).append({
+                "job_operation_id": job_operation_id,
+                "old_status": old_status,
+                "new_status": new_status,
+                "quantity_completed": update.get("quantity_completed"),
+                "quantity_rejected": quantity_rejected,
+            })
+    finally:
+        # Runs even if an unexpected error escapes the loop, so every
+        # change already applied is rolled up and audited
+        _finish_status_batch(transitions_by_job, last_now, tenant_id=tenant_id, user_id=user_id)
+
+    if logger.isEnabledFor(logging.INFO) and processed:
+        enqueue_log_event(
+            "OP_BATCH_STATUS_CHANGED",
+            {
+                "job_ids": list(transitions_by_job),
+                "processed": len(processed),
+                "unprocessed": len(unprocessed),
+                "user_id": user_id,
+            },
+        )
+
+    return {"processed": processed, "unprocessed": unprocessed}
+
+
 # -------------------------------------------------------
 # UNIFIED PLANNING & RESCHEDULING SERVICE (SCRUM 29 + 34)
 # -------------------------------------------------------
@@ -415,22 +817,26 @@ def plan_job_operation_service(
     *,
     tenant_id: str, # 👈 NEW: Require tenant_id
 ):
-    job_op = JOB_OPERATIONS_TABLE.get(job_operation_id)
-    if not job_op:
-        raise ValueError("Job operation not found")
-
-    # 👇 NEW: STRICT TENANT CHECK
-    if job_op.get("tenant_id") != tenant_id:
-        raise ValueError("Unauthorized access to job operation")
+    job_op = _get_tenant_job_op(job_operation_id, tenant_id)
     
 
-    current_status = job_op["status"]
+    current_status = job_op.status
 
     # 👇 NEW: STRICT STATE MACHINE GUARDS FOR PLANNING
     if current_status in {"COMPLETED", "CANCELLED"}:
         raise ValueError(f"Cannot reschedule or plan an operation that is {current_status}")
     # ... (keep the rest of the function exactly as it is) ...
 
+    # Idempotent retry: identical plan already stored, nothing to
+    # validate, re-index or audit
+    if (
+        job_op.machine_id == machine_id
+        and job_op.shift_id == shift_id
+        and job_op.planned_start_date == planned_start_date
+        and job_op.planned_end_date == planned_end_date
+    ):
+        return job_op
+
     # --- 1. Rescheduling Guards ---
     if current_status == "COMPLETED":
         raise ValueError("Cannot reschedule a COMPLETED operation")
@@ -442,13 +848,11 @@ def plan_job_operation_service(
             raise ValueError("Reschedule reason is required for active operations.")
 
     # --- 2. Standard Validation ---
-    tenant_id = job_op.get("tenant_id")
-    machine = MACHINES_TABLE.get(machine_id)
-    shift = SHIFTS_TABLE.get(shift_id)
-
-    if not machine or machine["tenant_id"] != tenant_id:
+    tenant_id = job_op.tenant_id
+    # Tenant-scoped lookups: other tenants' machines/shifts are simply absent
+    if machine_id not in MACHINES_BY_TENANT.get(tenant_id, NO_RECORDS):
         raise ValueError("Machine not found")
-    if not shift or shift["tenant_id"] != tenant_id:
+    if shift_id not in SHIFTS_BY_TENANT.get(tenant_id, NO_RECORDS):
         raise ValueError("Shift not found")
 
     try:
@@ -463,28 +867,13 @@ def plan_job_operation_service(
     # -------------------------------------------------------
     # CAPACITY & CONFLICT VALIDATION
     # -------------------------------------------------------
-    clashing_ops = []
-    
-    # Scan for existing operations on the same machine & shift
-    for other_op in JOB_OPERATIONS_TABLE.values():
-        if other_op["job_operation_id"] == job_operation_id:
-            continue # Skip self
-            
-        if other_op.get("machine_id") == machine_id and other_op.get("shift_id") == shift_id:
-            other_start_str = other_op.get("planned_start_date")
-            other_end_str = other_op.get("planned_end_date")
-            
-            if other_start_str and other_end_str:
-                other_start = datetime.fromisoformat(other_start_str)
-                other_end = datetime.fromisoformat(other_end_str)
-                
-                # Check for date overlap
-                if start_date <= other_end and end_date >= other_start:
-                    clashing_ops.append({
-                        "job_operation_id": other_op["job_operation_id"],
-                        "job_id": other_op["job_id"],
-                        "status": other_op["status"]
-                    })
+    clashing_ops = _scan_machine_shift(
+        machine_id,
+        shift_id,
+        start_date=start_date,
+        end_date=end_date,
+        exclude_id=job_operation_id,
+    )
 
     # Enforce capacity rule unless overridden
     if len(clashing_ops) >= MAX_OPS_PER_SHIFT:
@@ -514,36 +903,50 @@ def plan_job_operation_service(
     # Apply Updates & Audit
     # -------------------------------------------------------
     old_plan = {
-        "machine": job_op.get("machine_id"),
-        "start": job_op.get("planned_start_date")
+        "machine": job_op.machine_id,
+        "start": job_op.planned_start_date
     }
 
-    now = datetime.utcnow().isoformat()
-    job_op.update({
-        "machine_id": machine_id,
-        "shift_id": shift_id,
-        "planned_start_date": planned_start_date,
-        "planned_end_date": planned_end_date,
-        "updated_at": now,
-    })
+    # Move this op's interval in the machine schedule index
+    if job_op.machine_id and job_op._planned_start_dt and job_op._planned_end_dt:
+        MACHINE_SCHEDULE[(job_op.machine_id, job_op.shift_id)].remove(
+            (job_op._planned_start_dt, job_op._planned_end_dt, job_operation_id)
+        )
+    insort(
+        MACHINE_SCHEDULE.setdefault((machine_id, shift_id), []),
+        (start_date, end_date, job_operation_id),
+    )
+
+    now = now_iso()
+    job_op.machine_id = machine_id
+    job_op.shift_id = shift_id
+    job_op.planned_start_date = planned_start_date
+    job_op.planned_end_date = planned_end_date
+    job_op._planned_start_dt = start_date
+    job_op._planned_end_dt = end_date
+    job_op._planned_start_day = planned_start_date[:10]
+    job_op._planned_end_day = planned_end_date[:10]
+    job_op._planning_complete = True
+    job_op.updated_at = now
 
     event_type = "OP_PLANNED" if current_status == "NOT_STARTED" else "OP_RESCHEDULED"
     
-    logger.info(
-        event_type,
-        extra={
-            "job_operation_id": job_operation_id,
-            "old_plan": old_plan,
-            "new_machine": machine_id,
-            "reason": reschedule_reason,
-            "forced": force,
-            "ignored_conflicts": ignore_conflicts
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        enqueue_log_event(
+            event_type,
+            {
+                "job_operation_id": job_operation_id,
+                "old_plan": old_plan,
+                "new_machine": machine_id,
+                "reason": reschedule_reason,
+                "forced": force,
+                "ignored_conflicts": ignore_conflicts
+            },
+        )
 
     # WRITE TO THE AUDIT TRAIL
     log_audit_event(
-        tenant_id=job_op["tenant_id"],
+        tenant_id=job_op.tenant_id,
         entity_type="JOB_OPERATION",
         entity_id=job_operation_id,
         action=event_type,
@@ -584,20 +987,14 @@ def add_production_entry_service(
     # ---------------------------------------------------
     # 1. Fetch operation
     # ---------------------------------------------------
-    job_op = JOB_OPERATIONS_TABLE.get(job_operation_id)
-    if not job_op:
-        raise ValueError("Job operation not found")
-
-    # 👇 NEW: STRICT TENANT CHECK
-    if job_op.get("tenant_id") != tenant_id:
-        raise ValueError("Unauthorized access to job operation")
+    job_op = _get_tenant_job_op(job_operation_id, tenant_id)
 
     # ...  ...
 
     # ---------------------------------------------------
     # 2. Prevent editing if COMPLETED
     # ---------------------------------------------------
-    if job_op["status"] == OP_STATUS_COMPLETED:
+    if job_op.status == OP_STATUS_COMPLETED:
         raise ValueError("Cannot record production. Operation already COMPLETED")
 
     # ---------------------------------------------------
@@ -612,32 +1009,15 @@ def add_production_entry_service(
         raise ValueError("At least one quantity must be greater than zero")
 
     # ---------------------------------------------------
-    # 4. Get existing production entries
-    # ---------------------------------------------------
-    existing_entries = JOB_OPERATION_PRODUCTION_TABLE.get(job_operation_id, [])
-
-    total_produced = sum(e["produced_qty"] for e in existing_entries)
-    total_scrap = sum(e["scrap_qty"] for e in existing_entries)
-    total_rework = sum(e["rework_qty"] for e in existing_entries)
-
+    # 4. Parent job (read-only lookups, lock-free)
     # ---------------------------------------------------
-    # 5. Job Quantity Validation (STRICT RULE)
-    # ---------------------------------------------------
-    from app.db.mock_db import JOBS_TABLE
-
-    job = JOBS_TABLE.get(job_op["job_id"])
+    job = JOBS_TABLE.get(job_op.job_id)
     if not job:
         raise ValueError("Parent job not found")
 
     planned_qty = job["quantity"]
 
-    if total_produced + total_scrap + total_rework + total_entry > planned_qty:
-        raise ValueError("Production exceeds job quantity") 
-
-    # ---------------------------------------------------
-    # 6. Create production record
-    # ---------------------------------------------------
-    now = datetime.utcnow().isoformat()
+    now = now_iso()
 
     production_record = {
         "timestamp": now,
@@ -648,39 +1028,67 @@ def add_production_entry_service(
         "notes": notes,
     }
 
-    # Save entry
-    existing_entries.append(production_record)
-    JOB_OPERATION_PRODUCTION_TABLE[job_operation_id] = existing_entries 
-
-    # ---------------------------------------------------
-    # 7. Update computed totals on operation
-    # ---------------------------------------------------
-    job_op["total_produced"] = total_produced + produced_qty
-    job_op["total_scrap"] = total_scrap + scrap_qty
-    job_op["total_rework"] = total_rework + rework_qty
-
-    job_op["updated_at"] = now
+    # Read-check-write of the running totals is one critical section,
+    # so concurrent entries cannot both pass the quantity check
+    # (with DynamoDB: a conditional ADD on the three totals)
+    with _job_lock(job_op.job_id):
+        # Re-checked under the lock: the op may have been completed
+        # since the lock-free check in step 2
+        if job_op.status == OP_STATUS_COMPLETED:
+            raise ValueError("Cannot record production. Operation already COMPLETED")
+
+        # ---------------------------------------------------
+        # 5. Job Quantity Validation (STRICT RULE)
+        # ---------------------------------------------------
+        # Running totals live on the op (updated in step 7), so no re-sum
+        # of every past entry; None until the first entry is recorded
+        total_produced = job_op.total_produced or 0
+        total_scrap = job_op.total_scrap or 0
+        total_rework = job_op.total_rework or 0
+
+        if total_produced + total_scrap + total_rework + total_entry > planned_qty:
+            raise ValueError("Production exceeds job quantity") 
+
+        # ---------------------------------------------------
+        # 6. Save production record (append-only)
+        # ---------------------------------------------------
+        existing_entries = JOB_OPERATION_PRODUCTION_TABLE.setdefault(job_operation_id, [])
+        existing_entries.append(production_record)
+
+        # ---------------------------------------------------
+        # 7. Update computed totals on operation
+        # ---------------------------------------------------
+        job_op.total_produced = total_produced + produced_qty
+        job_op.total_scrap = total_scrap + scrap_qty
+        job_op.total_rework = total_rework + rework_qty
+
+        job_op.updated_at = now
+
+        totals = {
+            "total_produced": job_op.total_produced,
+            "total_scrap": job_op.total_scrap,
+            "total_rework": job_op.total_rework,
+        }
+        entries_count = len(existing_entries)
 
     # ---------------------------------------------------
     # 8. Audit log
     # ---------------------------------------------------
-    logger.info(
-        "PRODUCTION_RECORDED",
-        extra={
-            "job_operation_id": job_operation_id,
-            "operator_id": operator_id,
-            "produced_qty": produced_qty,
-            "scrap_qty": scrap_qty,
-            "rework_qty": rework_qty,
-        },
-    )
+    # isEnabledFor guards: skip building `extra` when INFO is filtered
+    if logger.isEnabledFor(logging.INFO):
+        enqueue_log_event(
+            "PRODUCTION_RECORDED",
+            {
+                "job_operation_id": job_operation_id,
+                "operator_id": operator_id,
+                "produced_qty": produced_qty,
+                "scrap_qty": scrap_qty,
+                "rework_qty": rework_qty,
+            },
+        )
 
     return {
         "job_operation_id": job_operation_id,
-        "totals": {
-            "total_produced": job_op["total_produced"],
-            "total_scrap": job_op["total_scrap"],
-            "total_rework": job_op["total_rework"],
-        },
-        "entries_count": len(existing_entries),
+        "totals": totals,
+        "entries_count": entries_count,
     }
\ No newline at end of file
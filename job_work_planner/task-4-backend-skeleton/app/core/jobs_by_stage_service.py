@@ -27,32 +27,33 @@ logger = logging.getLogger("jobwork-backend")
 # -------------------------------------------------------
 # TEMP MOCK IMPORTS (replace with DB later)
 # -------------------------------------------------------
-from app.db.mock_db import JOBS_TABLE, JOB_OPERATIONS_TABLE
+from app.db.mock_db import JOBS_BY_TENANT, JOB_DUE_DATES, NO_RECORDS
+from app.core.job_operations_service import get_job_operations
+
+# Kanban sort order: priority DESC
+PRIORITY_RANK = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
 
 
 # -------------------------------------------------------
 # Helper: Determine current stage of a job
 # -------------------------------------------------------
-def _get_current_stage(job_id: str) -> str:
+def _get_current_stage(operations: list) -> str:
     """
+    Args:
+        operations: the job's operations in sequence order
+                    (as returned by get_job_operations)
+
     Returns:
     - operation_id of first NOT_COMPLETED operation
     - 'COMPLETED' if all operations completed
     """
 
-    operations = [
-        op for op in JOB_OPERATIONS_TABLE.values()
-        if op["job_id"] == job_id
-    ]
-
     if not operations:
         return "NOT_PLANNED"
 
-    operations.sort(key=lambda x: x["sequence_number"])
-
     for op in operations:
-        if op["status"] != "COMPLETED":
-            return op["operation_id"]
+        if op.status != "COMPLETED":
+            return op.operation_id
 
     return "COMPLETED"
 
@@ -96,63 +97,49 @@ def get_jobs_by_stage_service(
             raise ValueError("Invalid date format. Use YYYY-MM-DD")
 
     # ---------------------------------------------------
-    # STEP 2: Fetch tenant jobs (exclude CANCELLED)
-    # ---------------------------------------------------
-    tenant_jobs = [
-        job for job in JOBS_TABLE.values()
-        if job["tenant_id"] == tenant_id
-        and job["status"] != "CANCELLED"
-    ]
-
-    # ---------------------------------------------------
-    # STEP 3: Group jobs by current stage
+    # STEPS 2-6: One pass over the tenant's jobs
+    # (cheapest filters first; card built straight into its stage)
     # ---------------------------------------------------
     stage_map = defaultdict(list)
+    delayed_counts = defaultdict(int)  # counted while building, not re-summed
+    today = datetime.utcnow().date()
+
+    for job in JOBS_BY_TENANT.get(tenant_id, NO_RECORDS).values():
+        # STEP 2: Exclude CANCELLED
+        job_status = job["status"]
+        if job_status == "CANCELLED":
+            continue
 
-    for job in tenant_jobs:
         job_id = job["job_id"]
 
-        current_stage = _get_current_stage(job_id)
+        # One index lookup per job (JOB_TO_OP_IDS), shared by the
+        # date-filter and stage steps instead of two table scans
+        job_ops = get_job_operations(job_id)
 
         # ------------------------------------------------
-        # STEP 4: Date filter (planned or active jobs)
+        # STEP 3: Date filter (planned or active jobs)
         # Rule (documented):
         # Include job if ANY operation planned on that date
+        # (dates parsed at planning time; no fromisoformat per scan)
         # ------------------------------------------------
-        if filter_date:
-            planned_ops = [
-                op for op in JOB_OPERATIONS_TABLE.values()
-                if op["job_id"] == job_id
-                and op.get("planned_start_date")
-                and op.get("planned_end_date")
-            ]
-
-            is_active_on_date = False
-
-            for op in planned_ops:
-                start = datetime.fromisoformat(op["planned_start_date"]).date()
-                end = datetime.fromisoformat(op["planned_end_date"]).date()
-
-                if start <= filter_date <= end:
-                    is_active_on_date = True
-                    break
-
-            if not is_active_on_date:
-                continue
+        if filter_date and not any(
+            op._planned_start_dt.date() <= filter_date <= op._planned_end_dt.date()
+            for op in job_ops
+            if op._planned_start_dt and op._planned_end_dt
+        ):
+            continue
 
         # ------------------------------------------------
-        # STEP 5: Compute delayed flag
+        # STEPS 4-6: Stage, delayed flag (due date parsed at
+        # job creation), job card
         # ------------------------------------------------
-        today = datetime.utcnow().date()
-        due_date = datetime.fromisoformat(job["due_date"]).date()
+        current_stage = _get_current_stage(job_ops)
+        delayed = today > JOB_DUE_DATES[job_id] and job_status != "COMPLETED"
+        if delayed:
+            delayed_counts[current_stage] += 1
 
-        delayed = today > due_date and job["status"] != "COMPLETED"
-
-        # ------------------------------------------------
-        # STEP 6: Build job card
-        # ------------------------------------------------
-        job_card = {
-            "job_id": job["job_id"],
+        stage_map[current_stage].append({
+            "job_id": job_id,
             "job_number": job["job_number"],
             "customer_id": job["customer_id"],
             "part_id": job["part_id"],
@@ -160,22 +147,18 @@ def get_jobs_by_stage_service(
             "due_date": job["due_date"],
             "priority": job["priority"],
             "delayed": delayed,
-        }
-
-        stage_map[current_stage].append(job_card)
+        })
 
     # ---------------------------------------------------
     # STEP 7: Sort jobs inside each stage
     # priority DESC → due_date ASC
     # ---------------------------------------------------
-    priority_rank = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
-
     stages_response = []
 
     for stage_id, jobs in stage_map.items():
         jobs.sort(
             key=lambda j: (
-                -priority_rank.get(j["priority"], 0),
+                -PRIORITY_RANK.get(j["priority"], 0),
                 j["due_date"],
             )
         )
@@ -187,7 +170,7 @@ def get_jobs_by_stage_service(
                 "jobs": jobs,
                 "counts": {
                     "total": len(jobs),
-                    "delayed": sum(1 for j in jobs if j["delayed"]),
+                    "delayed": delayed_counts[stage_id],
                 },
             }
         )
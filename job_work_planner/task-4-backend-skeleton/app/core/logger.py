@@ -3,7 +3,16 @@
 Central logging configuration for JobWork backend.
 """
  
+import atexit
+import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+ 
+ 
+# (logger, queue handler, listener) set up by get_logger;
+# torn down by shutdown_logging
+_queue_logging: list[tuple[logging.Logger, QueueHandler, QueueListener]] = []
  
  
 def get_logger(name: str = "jobwork-backend") -> logging.Logger:
@@ -21,6 +30,47 @@ def get_logger(name: str = "jobwork-backend") -> logging.Logger:
  
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+
+        # Request threads only enqueue records; a listener thread does
+        # the formatting + stream I/O (AUDIT / NOTIFICATION / job logs)
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        listener.start()
+
+        queue_handler = QueueHandler(log_queue)
+        logger.addHandler(queue_handler)
+        _queue_logging.append((logger, queue_handler, listener))
+ 
+    return logger
+ 
+ 
+def shutdown_logging() -> None:
+    """
+    Stops the queue listeners after they have written every queued
+    record. Called on app shutdown; idempotent.
+    A later get_logger() call sets logging up again.
+    """
+    while _queue_logging:
+        logger, queue_handler, listener = _queue_logging.pop()
+        logger.removeHandler(queue_handler)
+        listener.stop()
+ 
+ 
+# ---------------------------------------------------------
+# Structured event logging
+# ---------------------------------------------------------
+def enqueue_log_event(event: str, payload: dict) -> None:
+    """
+    Logs a structured service event as one line:
+    "<EVENT> | <payload as compact JSON>".
+
+    Goes through the queue-backed "jobwork-backend" logger, so the
+    request thread only builds the message and enqueues the record;
+    formatting and stream I/O happen on the listener thread.
+    """
+    logging.getLogger("jobwork-backend").info(
+        "%s | %s", event, json.dumps(payload, default=str, separators=(",", ":"))
+    )
+ 
  
-    return logger
\ No newline at end of file
+atexit.register(shutdown_logging)
@@ -1,12 +1,17 @@
 # app/core/metrics_service.py
 
+from bisect import bisect_left
 from datetime import datetime
 from collections import defaultdict
 import logging
 
 logger = logging.getLogger("jobwork-backend")
 
-from app.db.mock_db import JOBS_TABLE, JOB_OPERATIONS_TABLE, MACHINES_TABLE
+from app.db.mock_db import JOBS_TABLE, JOBS_BY_DUE_DATE, OPS_BY_TENANT_STATUS, NO_RECORDS, MACHINES_TABLE
+
+# Statuses read from OPS_BY_TENANT_STATUS (terminal buckets are never touched)
+WIP_STATUSES = ("READY", "IN_PROGRESS", "PAUSED")
+BACKLOG_STATUSES = ("NOT_STARTED",) + WIP_STATUSES  # not COMPLETED / CANCELLED
 
 # -------------------------------------------------------
 # 1. WIP by Stage
@@ -18,18 +23,15 @@ def get_wip_metrics_service(tenant_id: str, from_date: str | None = None, to_dat
     """
     wip_counts = defaultdict(int)
 
-    for op in JOB_OPERATIONS_TABLE.values():
-        if op.get("tenant_id") != tenant_id:
-            continue
-            
-        # Optional: Date filtering based on planned start
-        if from_date or to_date:
-            start = op.get("planned_start_date", "")[:10]
-            if from_date and start < from_date: continue
-            if to_date and start > to_date: continue
+    for status in WIP_STATUSES:
+        for op in OPS_BY_TENANT_STATUS.get((tenant_id, status), NO_RECORDS).values():
+            # Optional: Date filtering based on planned start
+            if from_date or to_date:
+                start = op._planned_start_day
+                if from_date and start < from_date: continue
+                if to_date and start > to_date: continue
 
-        if op["status"] in {"READY", "IN_PROGRESS", "PAUSED"}:
-            wip_counts[op["operation_id"]] += 1
+            wip_counts[op.operation_id] += 1
 
     # Format for charts (e.g., Recharts or Chart.js)
     return [{"stage": stage, "count": count} for stage, count in wip_counts.items()]
@@ -44,19 +46,15 @@ def get_bottleneck_metrics_service(tenant_id: str, from_date: str | None = None,
     """
     machine_load = defaultdict(int)
 
-    for op in JOB_OPERATIONS_TABLE.values():
-        if op.get("tenant_id") != tenant_id:
-            continue
-            
-        machine_id = op.get("machine_id")
-        if not machine_id:
-            continue # Skip unplanned operations
-
-        # Backlog = anything not completed or cancelled
-        if op["status"] not in {"COMPLETED", "CANCELLED"}:
-            
+    # Backlog = anything not completed or cancelled
+    for status in BACKLOG_STATUSES:
+        for op in OPS_BY_TENANT_STATUS.get((tenant_id, status), NO_RECORDS).values():
+            machine_id = op.machine_id
+            if not machine_id:
+                continue # Skip unplanned operations
+
             if from_date or to_date:
-                start = op.get("planned_start_date", "")[:10]
+                start = op._planned_start_day
                 if from_date and start < from_date: continue
                 if to_date and start > to_date: continue
 
@@ -66,7 +64,7 @@ def get_bottleneck_metrics_service(tenant_id: str, from_date: str | None = None,
     bottlenecks = [
         {
             "machine_id": m_id, 
-            "machine_name": MACHINES_TABLE.get(m_id, {}).get("machine_id", m_id),
+            "machine_name": getattr(MACHINES_TABLE.get(m_id), "machine_id", m_id),
             "pending_operations": count
         } 
         for m_id, count in machine_load.items()
@@ -86,11 +84,14 @@ def get_late_jobs_service(tenant_id: str) -> dict:
     today = datetime.utcnow().date().isoformat()
     late_jobs = []
 
-    for job in JOBS_TABLE.values():
-        if job.get("tenant_id") != tenant_id:
-            continue
-            
-        if job["status"] != "COMPLETED" and job["due_date"] < today:
+    # Index is sorted by due date: everything before the cut is overdue,
+    # already in oldest-first order
+    due_dates = JOBS_BY_DUE_DATE.get(tenant_id, [])
+    cut = bisect_left(due_dates, (today,))
+
+    for _, job_id in due_dates[:cut]:
+        job = JOBS_TABLE[job_id]
+        if job["status"] != "COMPLETED":
             late_jobs.append({
                 "job_id": job["job_id"],
                 "job_number": job["job_number"],
@@ -100,9 +101,6 @@ def get_late_jobs_service(tenant_id: str) -> dict:
                 "status": job["status"]
             })
 
-    # Sort by how late they are (oldest due date first)
-    late_jobs.sort(key=lambda x: x["due_date"])
-
     return {
         "total_late": len(late_jobs),
         "jobs": late_jobs
@@ -1,14 +1,32 @@
 # app/core/notification_service.py
 
+from itertools import count
+from operator import itemgetter
+import heapq
+import threading
 import uuid
-from datetime import datetime
 import logging
 
+from app.core.request_clock import now_iso
+
 logger = logging.getLogger("jobwork-backend")
 
 # MOCK DB: notification_id -> record
 NOTIFICATIONS_TABLE = {}
 
+# (tenant_id, user_id) -> [(seq, notification_id), ...] in creation order
+# (user_id None = tenant-wide broadcast)
+NOTIFICATIONS_BY_RECIPIENT = {}
+
+# Monotonic insertion sequence. created_at is the request-pinned time,
+# so overlapping requests can append out of created_at order; seq is
+# assigned and appended under one lock, so every list is sorted by it.
+_NOTIFICATION_SEQ = count()
+_NOTIFICATION_APPEND_LOCK = threading.Lock()
+
+# notification_ids not yet marked read
+UNREAD_NOTIFICATION_IDS = set()
+
 def create_notification(
     tenant_id: str, 
     user_id: str | None,  # If None, broadcasts to all Supervisors in tenant
@@ -28,10 +46,15 @@ def create_notification(
         "message": message,
         "entity_reference": entity_ref,
         "is_read": False,
-        "created_at": datetime.utcnow().isoformat()
+        "created_at": now_iso()
     }
     
     NOTIFICATIONS_TABLE[notif_id] = notification
+    UNREAD_NOTIFICATION_IDS.add(notif_id)
+    with _NOTIFICATION_APPEND_LOCK:
+        NOTIFICATIONS_BY_RECIPIENT.setdefault((tenant_id, user_id), []).append(
+            (next(_NOTIFICATION_SEQ), notif_id)
+        )
     
     logger.info(f"NOTIFICATION_CREATED | Type: {notif_type} | Ref: {entity_ref}")
     return notification
@@ -41,16 +64,25 @@ def get_user_notifications(tenant_id: str, user_id: str, unread_only: bool = Fal
     """
     Fetches notifications for a user (and tenant-wide broadcasts).
     """
-    user_notifs = [
-        n for n in NOTIFICATIONS_TABLE.values()
-        if n["tenant_id"] == tenant_id and (n["user_id"] == user_id or n["user_id"] is None)
-    ]
-    
-    if unread_only:
-        user_notifs = [n for n in user_notifs if not n["is_read"]]
-        
-    user_notifs.sort(key=lambda x: x["created_at"], reverse=True)
-    return user_notifs
+    # Only this user's and the tenant's broadcast lists are touched.
+    # Both are sorted by insertion seq, so walking them backwards and
+    # merging on seq gives newest-first without a sort.
+    recipient_lists = (
+        NOTIFICATIONS_BY_RECIPIENT.get((tenant_id, user_id), []),
+        NOTIFICATIONS_BY_RECIPIENT.get((tenant_id, None), []),
+    )
+    newest_first = heapq.merge(
+        *(
+            (
+                entry for entry in reversed(entries)
+                if not unread_only or entry[1] in UNREAD_NOTIFICATION_IDS
+            )
+            for entries in recipient_lists
+        ),
+        key=itemgetter(0),
+        reverse=True,
+    )
+    return [NOTIFICATIONS_TABLE[notif_id] for _, notif_id in newest_first]
 
 
 def mark_notification_read(notification_id: str, tenant_id: str) -> dict:
@@ -65,5 +97,6 @@ def mark_notification_read(notification_id: str, tenant_id: str) -> dict:
         raise ValueError("Unauthorized access to notification")
         
     notif["is_read"] = True
-    notif["read_at"] = datetime.utcnow().isoformat()
+    UNREAD_NOTIFICATION_IDS.discard(notification_id)
+    notif["read_at"] = now_iso()
     return notif
\ No newline at end of file
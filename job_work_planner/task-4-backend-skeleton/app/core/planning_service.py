@@ -2,12 +2,14 @@
 
 from datetime import datetime
 from collections import defaultdict
+from operator import attrgetter
+import heapq
 import logging
 
 logger = logging.getLogger("jobwork-backend")
 
 # Import mock tables
-from app.db.mock_db import JOBS_TABLE, JOB_OPERATIONS_TABLE, OPERATIONS_TABLE
+from app.db.mock_db import JOBS_TABLE, OPS_BY_TENANT, NO_RECORDS, OPERATIONS_TABLE
 def get_planning_calendar_service(
     *,
     tenant_id: str,
@@ -27,26 +29,23 @@ def get_planning_calendar_service(
     # ---------------------------------------------------
     filtered_ops = []
 
-    for op in JOB_OPERATIONS_TABLE.values():
-        if op.get("tenant_id") != tenant_id:
-            continue
-            
+    for op in OPS_BY_TENANT.get(tenant_id, NO_RECORDS).values():
         # Only include planned operations
-        if not op.get("machine_id") or not op.get("planned_start_date"):
+        if not op.machine_id or not op.planned_start_date:
             continue
 
-        if machine_id and op.get("machine_id") != machine_id:
+        if machine_id and op.machine_id != machine_id:
             continue
 
-        if shift_id and op.get("shift_id") != shift_id:
+        if shift_id and op.shift_id != shift_id:
             continue
 
-        if status and op.get("status") != status:
+        if status and op.status != status:
             continue
 
         # Date range filtering (Overlaps with from_date -> to_date)
-        op_start = op["planned_start_date"][:10]  # Get YYYY-MM-DD
-        op_end = op["planned_end_date"][:10] if op.get("planned_end_date") else op_start
+        op_start = op._planned_start_day  # YYYY-MM-DD, set when planned
+        op_end = op._planned_end_day or op_start
         
         if from_date and op_end < from_date:
             continue
@@ -58,12 +57,18 @@ def get_planning_calendar_service(
     # ---------------------------------------------------
     # 2. Sort & Paginate (Sort by start date)
     # ---------------------------------------------------
-    filtered_ops.sort(key=lambda x: (x["planned_start_date"], x.get("sequence_number", 0)))
-    
+    # Only the first end_idx rows are ever returned, so partially sort
+    # them (O(N log K)) instead of sorting the whole filtered list
     total_count = len(filtered_ops)
     start_idx = (page - 1) * page_size
     end_idx = start_idx + page_size
-    paginated_ops = filtered_ops[start_idx:end_idx]
+
+    sort_key = attrgetter("planned_start_date", "sequence_number")
+    if end_idx < total_count:
+        paginated_ops = heapq.nsmallest(end_idx, filtered_ops, key=sort_key)[start_idx:]
+    else:
+        filtered_ops.sort(key=sort_key)
+        paginated_ops = filtered_ops[start_idx:end_idx]
 
     # ---------------------------------------------------
     # 3. Enrich & Group (Machine -> Shift -> Date -> Ops)
@@ -72,24 +77,24 @@ def get_planning_calendar_service(
     calendar = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
 
     for op in paginated_ops:
-        job = JOBS_TABLE.get(op["job_id"], {})
-        op_master = OPERATIONS_TABLE.get(op["operation_id"], {})
+        job = JOBS_TABLE.get(op.job_id, {})
+        op_master = OPERATIONS_TABLE.get(op.operation_id)
 
-        op_date = op["planned_start_date"][:10]
-        m_id = op["machine_id"]
-        s_id = op["shift_id"]
+        op_date = op._planned_start_day
+        m_id = op.machine_id
+        s_id = op.shift_id
 
         # Build the enriched DTO required by the Acceptance Criteria
         enriched_op = {
-            "job_operation_id": op["job_operation_id"],
-            "job_id": op["job_id"],
+            "job_operation_id": op.job_operation_id,
+            "job_id": op.job_id,
             "job_number": job.get("job_number", "UNKNOWN"),
-            "op_name": op_master.get("name", op["operation_id"]),
-            "status": op["status"],
+            "op_name": op_master.name if op_master else op.operation_id,
+            "status": op.status,
             "planned_qty": job.get("quantity", 0),  # Job planned qty
             "due_date": job.get("due_date"),
             "priority": job.get("priority"),
-            "sequence_number": op["sequence_number"]
+            "sequence_number": op.sequence_number
         }
 
         calendar[m_id][s_id][op_date].append(enriched_op)
@@ -0,0 +1,47 @@
+"""
+request_clock.py
+----------------
+Per-request "now" timestamp.
+
+Responsibilities:
+- Capture the UTC timestamp once when an HTTP request starts
+- Let services share it via now_iso() instead of each calling
+  datetime.utcnow().isoformat() (batch endpoints call them many times)
+- Fall back to the live clock outside a request (scripts, startup)
+"""
+
+from contextvars import ContextVar
+from datetime import datetime
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+_REQUEST_NOW: ContextVar[str | None] = ContextVar("request_now", default=None)
+
+
+def now_iso() -> str:
+    """
+    Returns the current request's timestamp (naive UTC ISO string),
+    or the live clock when called outside a request.
+    """
+    return _REQUEST_NOW.get() or datetime.utcnow().isoformat()
+
+
+class RequestClockMiddleware:
+    """
+    Pure ASGI middleware that pins now_iso() for the request's duration.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _REQUEST_NOW.set(datetime.utcnow().isoformat())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _REQUEST_NOW.reset(token)
@@ -3,39 +3,204 @@
 Centralized Mock Database
 Prevents circular imports between routers and services.
 """
-from typing import Dict, List
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+import sys
+
+
+# -----------------------------
+# RECORD TYPES
+# -----------------------------
+@dataclass(slots=True)
+class JobOperation:
+    """
+    One row of JOB_OPERATIONS_TABLE.
+
+    Slotted record instead of a dict: smaller per row and cheaper
+    attribute access on the hot service paths. Optional fields stay
+    None until the corresponding step (planning, execution, production)
+    sets them.
+    """
+    job_operation_id: str
+    job_id: str
+    tenant_id: str
+    operation_id: str
+    sequence_number: int
+    status: str
+
+    # Planning (SCRUM 29/34)
+    machine_id: Optional[str] = None
+    shift_id: Optional[str] = None
+    planned_start_date: Optional[str] = None
+    planned_end_date: Optional[str] = None
+    # Parsed once when planned; internal only (not part of to_dict)
+    _planned_start_dt: Optional[datetime] = None
+    _planned_end_dt: Optional[datetime] = None
+    # YYYY-MM-DD prefixes of the planned dates, for day-range filters
+    # ("" until planned, so unplanned ops fall outside any range)
+    _planned_start_day: str = ""
+    _planned_end_day: str = ""
+    # True once machine, shift and both dates are set (one check
+    # instead of four when promoting the next op to READY)
+    _planning_complete: bool = False
+    needs_planning: Optional[bool] = None
+
+    # Execution (SCRUM 28/31)
+    actual_start_time: Optional[str] = None
+    started_by: Optional[str] = None
+    paused_at: Optional[str] = None
+    paused_by: Optional[str] = None
+    resumed_at: Optional[str] = None
+    resumed_by: Optional[str] = None
+    actual_end_time: Optional[str] = None
+    completed_by: Optional[str] = None
+    quantity_completed: Optional[int] = None
+    quantity_rejected: Optional[int] = None
+
+    # Production totals (SCRUM 32)
+    total_produced: Optional[int] = None
+    total_scrap: Optional[int] = None
+    total_rework: Optional[int] = None
+
+    updated_at: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """
+        API representation: only the fields that have been set.
+        """
+        return {
+            name: value
+            for name in _JOB_OPERATION_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+_JOB_OPERATION_FIELDS = tuple(
+    f.name for f in fields(JobOperation) if not f.name.startswith("_")
+)
+
 
 # -----------------------------
 # MOCK DATABASE TABLES
 # -----------------------------
 JOBS_TABLE: Dict[str, Dict] = {}
-JOB_OPERATIONS_TABLE: Dict[str, Dict] = {}
+JOB_OPERATIONS_TABLE: Dict[str, JobOperation] = {}
 JOB_OPERATION_PRODUCTION_TABLE: Dict[str, List[Dict]] = {}
 JOB_OPERATION_RESCHEDULE_TABLE: Dict[str, List[Dict]] = {}
 
-MACHINES_TABLE = {
-    "machine-1": {"machine_id": "machine-1", "tenant_id": "tenant-1"},
-    "machine-2": {"machine_id": "machine-2", "tenant_id": "tenant-1"},
-}
-
-SHIFTS_TABLE = {
-    "shift-A": {"shift_id": "shift-A", "tenant_id": "tenant-1"},
-    "shift-B": {"shift_id": "shift-B", "tenant_id": "tenant-1"},
-}
-
-PARTS_TABLE = {
-    "part-1": {
-        "part_id": "part-1",
-        "tenant_id": "tenant-1",
-        "default_operations_route": ["op-cut", "op-drill", "op-paint"],
-    }
-}
-
-OPERATIONS_TABLE = {
-    "op-cut": {"operation_id": "op-cut", "name": "Cut"},
-    "op-drill": {"operation_id": "op-drill", "name": "Drill"},
-    "op-paint": {"operation_id": "op-paint", "name": "Paint"},
-}
+# -----------------------------
+# SECONDARY INDEXES
+# (maintained by job_operations_service on every write)
+# -----------------------------
+# job_id -> [job_operation_id, ...] in sequence order
+JOB_TO_OP_IDS: Dict[str, List[str]] = {}
+
+# (job_id, sequence_number) -> job_operation_id
+JOB_SEQ_INDEX: Dict[Tuple[str, int], str] = {}
+
+# job_id -> {operation status: count}
+JOB_STATUS_COUNTS: Dict[str, Dict[str, int]] = {}
+
+# job_id -> due_date parsed once at creation (the row keeps the ISO string)
+JOB_DUE_DATES: Dict[str, date] = {}
+
+# tenant_id -> {job_id: job}  (same row objects as JOBS_TABLE)
+JOBS_BY_TENANT: Dict[str, Dict[str, Dict]] = {}
+
+# tenant_id -> [(due_date, job_id), ...]
+# kept sorted (bisect.insort) so late jobs are one bisect + slice
+JOBS_BY_DUE_DATE: Dict[str, List[Tuple[str, str]]] = {}
+
+# tenant_id -> {job_operation_id: JobOperation}
+OPS_BY_TENANT: Dict[str, Dict[str, JobOperation]] = {}
+
+# (tenant_id, status) -> {job_operation_id: JobOperation}
+# lets metrics read only the live (non-terminal) buckets
+OPS_BY_TENANT_STATUS: Dict[Tuple[str, str], Dict[str, JobOperation]] = {}
+
+# (machine_id, shift_id) -> [(planned_start, planned_end, job_operation_id), ...]
+# kept sorted by planned_start (bisect.insort) for conflict checks
+MACHINE_SCHEDULE: Dict[Tuple[str, str], List[Tuple[datetime, datetime, str]]] = {}
+
+# -----------------------------
+# REFERENCE DATA (read-only)
+# -----------------------------
+@dataclass(frozen=True, slots=True)
+class Machine:
+    machine_id: str
+    tenant_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class Shift:
+    shift_id: str
+    tenant_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class Part:
+    part_id: str
+    tenant_id: str
+    default_operations_route: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    operation_id: str
+    name: str
+
+
+def _reference_table(records: Dict[str, object]) -> Mapping[str, object]:
+    """
+    Freezes a master-data table: read-only mapping of interned keys
+    to frozen records.
+    """
+    return MappingProxyType({sys.intern(key): record for key, record in records.items()})
+
+
+MACHINES_TABLE: Mapping[str, Machine] = _reference_table({
+    "machine-1": Machine("machine-1", "tenant-1"),
+    "machine-2": Machine("machine-2", "tenant-1"),
+})
+
+SHIFTS_TABLE: Mapping[str, Shift] = _reference_table({
+    "shift-A": Shift("shift-A", "tenant-1"),
+    "shift-B": Shift("shift-B", "tenant-1"),
+})
+
+PARTS_TABLE: Mapping[str, Part] = _reference_table({
+    "part-1": Part(
+        part_id="part-1",
+        tenant_id="tenant-1",
+        default_operations_route=("op-cut", "op-drill", "op-paint"),
+    ),
+})
+
+OPERATIONS_TABLE: Mapping[str, Operation] = _reference_table({
+    "op-cut": Operation("op-cut", "Cut"),
+    "op-drill": Operation("op-drill", "Drill"),
+    "op-paint": Operation("op-paint", "Paint"),
+})
+
+# tenant_id -> {id: record}: existence + tenant check in one lookup
+def _group_by_tenant(table: Mapping[str, object]) -> Mapping[str, Mapping[str, object]]:
+    grouped: Dict[str, Dict[str, object]] = defaultdict(dict)
+    for key, record in table.items():
+        grouped[record.tenant_id][key] = record
+    return MappingProxyType(
+        {tenant_id: MappingProxyType(rows) for tenant_id, rows in grouped.items()}
+    )
+
+
+MACHINES_BY_TENANT: Mapping[str, Mapping[str, Machine]] = _group_by_tenant(MACHINES_TABLE)
+SHIFTS_BY_TENANT: Mapping[str, Mapping[str, Shift]] = _group_by_tenant(SHIFTS_TABLE)
+PARTS_BY_TENANT: Mapping[str, Mapping[str, Part]] = _group_by_tenant(PARTS_TABLE)
+
+# Shared fallback for tenants with no reference data
+NO_RECORDS: Mapping[str, object] = MappingProxyType({})
 
 MOCK_CUSTOMERS = {
     "cust-1": {"tenant_id": "tenant-1"}
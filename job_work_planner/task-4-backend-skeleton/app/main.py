@@ -9,6 +9,8 @@ Responsibilities:
 - Register all API routers
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from app.routes import planning
 from app.routes import metrics
@@ -23,13 +25,33 @@ from app.routes import system, auth, jobs, job_operations
 # Middleware
 # ---------------------------------------------------------
 from app.core.auth_middleware import JWTAuthMiddleware
+from app.core.request_clock import RequestClockMiddleware
+
+# ---------------------------------------------------------
+# Logging
+# ---------------------------------------------------------
+# Configure "jobwork-backend" once at startup (queue handler +
+# listener thread); every module logs through that named logger.
+from app.core.logger import get_logger, shutdown_logging
+
+get_logger()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_logger()  # no-op unless a previous shutdown tore it down
+    yield
+    # Write out anything still queued before the process exits
+    shutdown_logging()
+
 
 # ---------------------------------------------------------
 # Create FastAPI app
 # ---------------------------------------------------------
 app = FastAPI(
     title="JobWork Backend Skeleton",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # ---------------------------------------------------------
@@ -38,7 +60,10 @@ app = FastAPI(
 # NOTE:
 # JWTAuthMiddleware is implemented as ASGI middleware,
 # so it MUST be registered using add_middleware()
+# The last one added runs first: auth rejects before the
+# request clock is started.
 # ---------------------------------------------------------
+app.add_middleware(RequestClockMiddleware)
 app.add_middleware(JWTAuthMiddleware)
 
 # ---------------------------------------------------------
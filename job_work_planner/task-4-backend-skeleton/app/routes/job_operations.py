@@ -10,13 +10,14 @@ SCRUM 32: Production Entry
 RBAC: Strict Role Enforcement
 """
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Query, status
 
 # -------------------------------------------------------
 # Import service layer functions
 # -------------------------------------------------------
 from app.core.job_operations_service import (
     update_job_operation_status,
+    bulk_update_job_operation_status,
     plan_job_operation_service,
     add_production_entry_service,
     JOB_OPERATIONS_TABLE,
@@ -90,7 +91,57 @@ def update_operation_status(
             detail=str(exc)
         )
 
-    return updated_operation
+    return updated_operation.to_dict()
+
+
+# =======================================================
+# SCRUM 28 + SCRUM 31 (batch)
+# POST /job-operations/status-batch
+# =======================================================
+@router.post("/status-batch")
+def bulk_update_operation_status(
+    payload: dict,
+    request: Request,
+):
+    """
+    Applies several status updates in one request.
+    Body: {"updates": [{"job_operation_id": ..., "status": ..., ...}]}
+    A malformed batch is rejected with 400; items that fail status
+    validation are returned in `unprocessed`.
+    Allowed Roles: OPERATOR, SUPERVISOR, ADMIN
+    """
+
+    # 1. Authentication
+    if not hasattr(request.state, "user"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+    user = request.state.user
+    role = user.get("role", "OPERATOR")
+
+    # 2. RBAC (same rule as the single update)
+    if role not in {"OPERATOR", "SUPERVISOR", "ADMIN", "OWNER"}:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Forbidden: Only Operators, Supervisors, or Admins can update execution status."
+        )
+
+    # 3. Call service layer (rejects a malformed batch before applying anything)
+    try:
+        result = bulk_update_job_operation_status(
+            payload.get("updates"),
+            tenant_id=user["tenant_id"],
+            user_id=user["user_id"],
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+
+    return {
+        "processed": [op.to_dict() for op in result["processed"]],
+        "unprocessed": result["unprocessed"],
+    }
 
 
 # =======================================================
@@ -164,7 +215,7 @@ def plan_job_operation(
             detail=str(exc)
         )
 
-    return updated_operation
+    return updated_operation.to_dict()
 
 
 # =======================================================
@@ -230,10 +281,10 @@ def get_job_operation(
         raise HTTPException(status_code=404, detail="Job operation not found")
 
     # 👇 NEW: STRICT TENANT CHECK
-    if job_op.get("tenant_id") != request.state.user["tenant_id"]:
+    if job_op.tenant_id != request.state.user["tenant_id"]:
         raise HTTPException(status_code=404, detail="Job operation not found")
 
-    return job_op
+    return job_op.to_dict()
 
 # =======================================================
 # AUDIT TRAIL
@@ -242,7 +293,8 @@ def get_job_operation(
 @router.get("/{job_operation_id}/audit")
 def get_job_operation_audit(
     job_operation_id: str,
-    request: Request
+    request: Request,
+    limit: int | None = Query(None, ge=1, description="Newest N entries only"),
 ):
     """
     Fetch the immutable audit trail for a specific Job Operation.
@@ -255,7 +307,8 @@ def get_job_operation_audit(
     trail = get_audit_trail(
         tenant_id=tenant_id,
         entity_type="JOB_OPERATION",
-        entity_id=job_operation_id
+        entity_id=job_operation_id,
+        limit=limit,
     )
 
     return {"audit_trail": trail}
\ No newline at end of file
@@ -15,6 +15,7 @@ IMPORTANT DESIGN RULES:
 """
 
 from fastapi import APIRouter, HTTPException, Request, status
+from bisect import insort
 from datetime import datetime
 import uuid
 import logging
@@ -22,10 +23,19 @@ import logging
 # ---------------------------------------------------------------
 # Import Scrum 25 service (business logic, NOT API)
 # ---------------------------------------------------------------
-from app.core.job_operations_service import create_job_operations
-
-
-from app.db.mock_db import JOBS_TABLE, MOCK_CUSTOMERS, PARTS_TABLE as MOCK_PARTS
+from app.core.job_operations_service import create_job_operations, get_job_operations
+from app.core.request_clock import now_iso
+
+
+from app.db.mock_db import (
+    JOBS_TABLE,
+    JOBS_BY_TENANT,
+    JOBS_BY_DUE_DATE,
+    JOB_DUE_DATES,
+    MOCK_CUSTOMERS,
+    NO_RECORDS,
+    PARTS_BY_TENANT,
+)
 
 # ---------------------------------------------------------------
 # Router
@@ -118,6 +128,15 @@ def create_job(payload: dict, request: Request):
             detail="Invalid priority"
         )
 
+    # Parsed once here; read paths use JOB_DUE_DATES instead of re-parsing
+    try:
+        due_date_parsed = datetime.fromisoformat(due_date).date()
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid date format. Use YYYY-MM-DD"
+        )
+
     # ISO date string comparison works correctly here
     if due_date < received_date:
         raise HTTPException(
@@ -137,10 +156,7 @@ def create_job(payload: dict, request: Request):
             detail="Invalid customer"
         )
 
-    if (
-        part_id not in MOCK_PARTS
-        or MOCK_PARTS[part_id]["tenant_id"] != tenant_id
-    ):
+    if part_id not in PARTS_BY_TENANT.get(tenant_id, NO_RECORDS):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid part"
@@ -151,14 +167,12 @@ def create_job(payload: dict, request: Request):
     # -----------------------------------------------------------
     job_id = str(uuid.uuid4())
 
-    tenant_job_count = sum(
-        1 for job in JOBS_TABLE.values()
-        if job["tenant_id"] == tenant_id
-    )
+    tenant_jobs = JOBS_BY_TENANT.setdefault(tenant_id, {})
+    tenant_job_count = len(tenant_jobs)
 
     job_number = f"JOB-{tenant_id.upper()}-{tenant_job_count + 1:04d}"
 
-    now = datetime.utcnow().isoformat()
+    now = now_iso()
 
     job = {
         "job_id": job_id,
@@ -178,6 +192,10 @@ def create_job(payload: dict, request: Request):
 
     # Persist job header
     JOBS_TABLE[job_id] = job
+    tenant_jobs[job_id] = job
+    JOB_DUE_DATES[job_id] = due_date_parsed
+    due_date_index = JOBS_BY_DUE_DATE.setdefault(tenant_id, [])
+    insort(due_date_index, (due_date, job_id))
 
     # -----------------------------------------------------------
     # 7. SCRUM 25 – Auto-generate Job Operations (ATOMIC)
@@ -191,6 +209,9 @@ def create_job(payload: dict, request: Request):
     except Exception as e:
         # 🔥 Rollback job header if route creation fails
         JOBS_TABLE.pop(job_id, None)
+        tenant_jobs.pop(job_id, None)
+        JOB_DUE_DATES.pop(job_id, None)
+        due_date_index.remove((due_date, job_id))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -282,10 +303,7 @@ def list_jobs(
     # ---------------------------------------------------------------
     # 3. Tenant isolation
     # ---------------------------------------------------------------
-    jobs = [
-        job for job in JOBS_TABLE.values()
-        if job["tenant_id"] == tenant_id
-    ]
+    jobs = list(JOBS_BY_TENANT.get(tenant_id, NO_RECORDS).values())
 
     # ---------------------------------------------------------------
     # 4. Apply filters
@@ -448,15 +466,8 @@ def get_job_detail(job_id: str, request: Request):
     # ---------------------------------------------------------------
     # 3. Fetch job operations (Scrum 25 data)
     # ---------------------------------------------------------------
-    from app.db.mock_db import JOB_OPERATIONS_TABLE
-
-    operations = [
-        op for op in JOB_OPERATIONS_TABLE.values()
-        if op["job_id"] == job_id
-    ]
-
-    # Sort by sequence_number
-    operations.sort(key=lambda op: op["sequence_number"])
+    # Served from the job_id index, already in sequence order
+    operations = get_job_operations(job_id)
 
     # ---------------------------------------------------------------
     # 4. Compute current_stage
@@ -464,15 +475,15 @@ def get_job_detail(job_id: str, request: Request):
     current_stage = "COMPLETED"
 
     for op in operations:
-        if op["status"] != "COMPLETED":
-            current_stage = op["operation_id"]
+        if op.status != "COMPLETED":
+            current_stage = op.operation_id
             break
 
     # ---------------------------------------------------------------
     # 5. Compute delayed flag
     # ---------------------------------------------------------------
     today = datetime.utcnow().date()
-    due_date = datetime.fromisoformat(job["due_date"]).date()
+    due_date = JOB_DUE_DATES[job_id]
 
     delayed = today > due_date and job["status"] != "COMPLETED"
 
@@ -485,7 +496,7 @@ def get_job_detail(job_id: str, request: Request):
             "current_stage": current_stage,
             "delayed": delayed
         },
-        "operations": operations
+        "operations": [op.to_dict() for op in operations]
     }
 
 
@@ -500,7 +511,8 @@ from app.core.audit_service import get_audit_trail
 @router.get("/{job_id}/audit")
 def get_job_audit(
     job_id: str,
-    request: Request
+    request: Request,
+    limit: int | None = Query(None, ge=1, description="Newest N entries only"),
 ):
     """
     Fetch the immutable audit trail for a specific Job.
@@ -517,7 +529,8 @@ def get_job_audit(
     trail = get_audit_trail(
         tenant_id=tenant_id,
         entity_type="JOB",
-        entity_id=job_id
+        entity_id=job_id,
+        limit=limit,
     )
 
     return {"audit_trail": trail}
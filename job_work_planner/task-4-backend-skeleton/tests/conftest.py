@@ -0,0 +1,11 @@
+import pytest
+
+from app.core.logger import shutdown_logging
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _flush_logs_before_capture_closes():
+    # TestClient is used without its lifespan, so stop the log listener
+    # here; at interpreter exit pytest has already closed captured stderr
+    yield
+    shutdown_logging()
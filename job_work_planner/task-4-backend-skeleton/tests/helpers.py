@@ -0,0 +1,71 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.audit_service import get_audit_trail
+from app.db.mock_db import JOB_TO_OP_IDS
+
+
+client = TestClient(app)
+HEADERS = {"Authorization": "Bearer test123"}
+TENANT_ID = "tenant-1"
+
+
+def create_job(due_date="2099-02-01"):
+    """Creates a job through the API; returns (job_id, op_ids in sequence order)."""
+    response = client.post(
+        "/jobs/",
+        json={
+            "customer_id": "cust-1",
+            "part_id": "part-1",
+            "quantity": 10,
+            "received_date": "2000-01-01",
+            "due_date": due_date,
+            "priority": "HIGH",
+        },
+        headers=HEADERS,
+    )
+    assert response.status_code == 201, response.text
+    job_id = response.json()["job"]["job_id"]
+    return job_id, list(JOB_TO_OP_IDS[job_id])
+
+
+def plan(op_id, start, end, machine_id="machine-1"):
+    # Tests share the in-memory tables, so skip the capacity check
+    response = client.patch(
+        f"/job-operations/{op_id}/plan",
+        json={
+            "machine_id": machine_id,
+            "shift_id": "shift-A",
+            "planned_start_date": start,
+            "planned_end_date": end,
+            "ignore_conflicts": True,
+            "force": True,
+            "reason": "test",
+        },
+        headers=HEADERS,
+    )
+    assert response.status_code == 200, response.text
+
+
+def create_planned_job():
+    job_id, op_ids = create_job()
+    for day, op_id in enumerate(op_ids, start=1):
+        plan(op_id, f"2030-01-0{day}", f"2030-01-0{day + 1}")
+    return job_id, op_ids
+
+
+def set_status(op_id, new_status, **extra):
+    return client.patch(
+        f"/job-operations/{op_id}/status",
+        json={"status": new_status, **extra},
+        headers=HEADERS,
+    )
+
+
+def job_status(job_id):
+    return client.get(f"/jobs/{job_id}", headers=HEADERS).json()["job"]["status"]
+
+
+def op_audit_actions(op_id):
+    trail = get_audit_trail(TENANT_ID, "JOB_OPERATION", op_id)
+    return [entry["action"] for entry in trail]
@@ -0,0 +1,46 @@
+from tests.helpers import HEADERS, client
+
+
+def test_public_path_needs_no_token():
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+
+def test_missing_authorization_header_is_401():
+    response = client.get("/jobs/")
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Authorization header missing"}
+
+
+def test_non_bearer_authorization_header_is_401():
+    response = client.get("/jobs/", headers={"Authorization": "Basic test123"})
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid Authorization header format"}
+
+
+def test_wrong_token_is_401():
+    response = client.get("/jobs/", headers={"Authorization": "Bearer nope"})
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid or expired token"}
+
+
+def test_valid_token_reaches_route_with_user_context():
+    response = client.get("/jobs/", headers=HEADERS)
+
+    assert response.status_code == 200
+    assert "items" in response.json()
+
+
+def test_repeated_401s_are_identical():
+    # Rejections replay prebuilt ASGI messages; make sure they stay intact
+    first = client.get("/jobs/")
+    second = client.get("/jobs/")
+
+    assert first.status_code == second.status_code == 401
+    assert first.content == second.content
+    assert first.headers["content-type"] == "application/json"
@@ -0,0 +1,114 @@
+import pytest
+
+from app.core.audit_service import get_audit_trail
+from app.core.job_operations_service import bulk_update_job_operation_status
+from app.db.mock_db import JOB_OPERATIONS_TABLE
+from tests.helpers import (
+    HEADERS,
+    TENANT_ID,
+    client,
+    create_planned_job,
+    job_status,
+    op_audit_actions,
+)
+
+
+def _post_batch(updates, headers=HEADERS):
+    return client.post("/job-operations/status-batch", json={"updates": updates}, headers=headers)
+
+
+def test_batch_applies_updates_in_order_and_audits_each_op():
+    job_id, op_ids = create_planned_job()
+    first = op_ids[0]
+
+    response = _post_batch([
+        {"job_operation_id": first, "status": "IN_PROGRESS"},
+        {"job_operation_id": first, "status": "COMPLETED", "quantity_completed": 10},
+    ])
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [op["status"] for op in body["processed"]] == ["COMPLETED", "COMPLETED"]
+    assert body["unprocessed"] == []
+
+    # Same per-op trail as two single updates, plus one job-level summary
+    assert op_audit_actions(first).count("STATUS_CHANGED") == 2
+    job_trail = get_audit_trail(TENANT_ID, "JOB", job_id)
+    assert [entry["action"] for entry in job_trail] == ["OP_BATCH_STATUS_CHANGED"]
+    assert all("timestamp_ns" not in entry for entry in job_trail)
+
+    # Completing the first op unblocked the (planned) second one
+    assert JOB_OPERATIONS_TABLE[op_ids[1]].status == "READY"
+
+
+def test_batch_partial_failure_keeps_applied_items():
+    job_id, op_ids = create_planned_job()
+    first, second, _ = op_ids
+
+    response = _post_batch([
+        {"job_operation_id": first, "status": "IN_PROGRESS"},
+        {"job_operation_id": second, "status": "COMPLETED", "quantity_completed": 1},
+        {"job_operation_id": "missing-op", "status": "IN_PROGRESS"},
+    ])
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [op["job_operation_id"] for op in body["processed"]] == [first]
+    assert [item["job_operation_id"] for item in body["unprocessed"]] == [second, "missing-op"]
+
+    # The applied item was rolled up and audited
+    assert job_status(job_id) == "IN_PROGRESS"
+    assert op_audit_actions(first).count("STATUS_CHANGED") == 1
+    assert JOB_OPERATIONS_TABLE[second].status == "NOT_STARTED"
+
+
+@pytest.mark.parametrize("updates", [
+    [],
+    ["x"],
+    [{"job_operation_id": "op"}],
+    [
+        {"job_operation_id": "op", "status": "IN_PROGRESS"},
+        {"job_operation_id": "op", "status": "COMPLETED", "quantity_completed": "5"},
+    ],
+    [{"job_operation_id": "op", "status": "IN_PROGRESS", "override_sequence": "yes"}],
+    [{"job_operation_id": "op", "status": "COMPLETED", "quantity_completed": True}],
+])
+def test_batch_rejects_malformed_items_before_applying_anything(updates):
+    _, op_ids = create_planned_job()
+    first = op_ids[0]
+    updates = [
+        {**item, "job_operation_id": first} if isinstance(item, dict) else item
+        for item in updates
+    ]
+
+    response = _post_batch(updates)
+
+    assert response.status_code == 400, response.text
+    assert JOB_OPERATIONS_TABLE[first].status == "READY"
+    assert "STATUS_CHANGED" not in op_audit_actions(first)
+
+
+def test_batch_service_rejects_malformed_batch_with_value_error():
+    # Direct service callers get the same up-front check as the route
+    _, op_ids = create_planned_job()
+    first = op_ids[0]
+
+    with pytest.raises(ValueError, match=r"updates\[2\] must be an object"):
+        bulk_update_job_operation_status(
+            [
+                {"job_operation_id": first, "status": "IN_PROGRESS"},
+                {"job_operation_id": first, "status": "PAUSED"},
+                "not-a-dict",
+            ],
+            tenant_id=TENANT_ID,
+            user_id="test-user",
+        )
+
+    assert JOB_OPERATIONS_TABLE[first].status == "READY"
+    assert "STATUS_CHANGED" not in op_audit_actions(first)
+
+
+def test_batch_requires_auth():
+    response = _post_batch([], headers={})
+
+    assert response.status_code == 401
@@ -0,0 +1,27 @@
+from app.db.mock_db import JOB_STATUS_COUNTS
+from tests.helpers import create_planned_job, op_audit_actions, plan, set_status
+
+
+def test_repeated_status_is_a_no_op():
+    job_id, op_ids = create_planned_job()
+    op_id = op_ids[0]
+
+    assert set_status(op_id, "IN_PROGRESS").status_code == 200
+    counts = dict(JOB_STATUS_COUNTS[job_id])
+
+    response = set_status(op_id, "IN_PROGRESS")
+
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == "IN_PROGRESS"
+    assert op_audit_actions(op_id).count("STATUS_CHANGED") == 1
+    assert JOB_STATUS_COUNTS[job_id] == counts
+
+
+def test_repeated_plan_is_a_no_op():
+    _, op_ids = create_planned_job()
+    op_id = op_ids[0]
+    actions = op_audit_actions(op_id)
+
+    plan(op_id, "2030-01-01", "2030-01-02")
+
+    assert op_audit_actions(op_id) == actions
@@ -0,0 +1,124 @@
+from collections import Counter
+
+from app.db.mock_db import (
+    JOB_OPERATIONS_TABLE,
+    JOB_SEQ_INDEX,
+    JOB_STATUS_COUNTS,
+    JOB_TO_OP_IDS,
+    JOBS_BY_DUE_DATE,
+    JOBS_BY_TENANT,
+    JOBS_TABLE,
+    MACHINE_SCHEDULE,
+    OPS_BY_TENANT,
+    OPS_BY_TENANT_STATUS,
+)
+from tests.helpers import (
+    HEADERS,
+    TENANT_ID,
+    client,
+    create_job,
+    create_planned_job,
+    job_status,
+    plan,
+    set_status,
+)
+
+
+def _status_counts(job_id):
+    # Zero counts are left behind when the last op leaves a status
+    return {status: n for status, n in JOB_STATUS_COUNTS[job_id].items() if n}
+
+
+def test_create_job_indexes_its_ops_in_sequence_order():
+    job_id, op_ids = create_job()
+
+    ops = [JOB_OPERATIONS_TABLE[op_id] for op_id in JOB_TO_OP_IDS[job_id]]
+    assert [op.sequence_number for op in ops] == [1, 2, 3]
+    assert all(op.job_id == job_id for op in ops)
+
+
+def test_seq_index_points_at_each_op():
+    job_id, op_ids = create_job()
+
+    for op_id in op_ids:
+        sequence_number = JOB_OPERATIONS_TABLE[op_id].sequence_number
+        assert JOB_SEQ_INDEX[(job_id, sequence_number)] == op_id
+    assert (job_id, len(op_ids) + 1) not in JOB_SEQ_INDEX
+
+
+def test_status_counters_follow_status_changes():
+    job_id, op_ids = create_planned_job()
+    first, second, _ = op_ids
+
+    steps = [
+        (first, "IN_PROGRESS", {}),
+        (first, "PAUSED", {}),
+        (first, "IN_PROGRESS", {}),
+        (first, "COMPLETED", {"quantity_completed": 10}),
+        (second, "IN_PROGRESS", {}),
+    ]
+    for op_id, new_status, extra in steps:
+        response = set_status(op_id, new_status, **extra)
+        assert response.status_code == 200, (new_status, response.text)
+        ops = [JOB_OPERATIONS_TABLE[i] for i in op_ids]
+        assert _status_counts(job_id) == Counter(op.status for op in ops)
+
+    # The parent job status is decided from the counters
+    assert job_status(job_id) == "IN_PROGRESS"
+
+
+def test_reschedule_moves_machine_schedule_entry():
+    _, op_ids = create_planned_job()
+    op_id = op_ids[0]
+
+    plan(op_id, "2031-05-01", "2031-05-02", machine_id="machine-2")
+
+    entries = [
+        key
+        for key, schedule in MACHINE_SCHEDULE.items()
+        for entry in schedule
+        if entry[2] == op_id
+    ]
+    assert entries == [("machine-2", "shift-A")]
+    for schedule in MACHINE_SCHEDULE.values():
+        assert schedule == sorted(schedule)
+
+
+def test_create_job_adds_job_and_ops_to_tenant_indexes():
+    job_id, op_ids = create_job()
+
+    assert JOBS_BY_TENANT[TENANT_ID][job_id] is JOBS_TABLE[job_id]
+    for op_id in op_ids:
+        assert OPS_BY_TENANT[TENANT_ID][op_id] is JOB_OPERATIONS_TABLE[op_id]
+
+
+def test_tenant_status_buckets_follow_status_changes():
+    _, op_ids = create_planned_job()
+    first, second, _ = op_ids
+
+    set_status(first, "IN_PROGRESS")
+    set_status(first, "COMPLETED", quantity_completed=10)
+
+    # Each op sits in exactly the bucket of its current status
+    for op_id in op_ids:
+        op = JOB_OPERATIONS_TABLE[op_id]
+        buckets = [
+            status
+            for (tenant_id, status), bucket in OPS_BY_TENANT_STATUS.items()
+            if tenant_id == TENANT_ID and op_id in bucket
+        ]
+        assert buckets == [op.status]
+    assert JOB_OPERATIONS_TABLE[second].status == "READY"
+
+
+def test_late_jobs_come_from_due_date_index():
+    late_job_id, _ = create_job(due_date="2001-01-01")
+    future_job_id, _ = create_job(due_date="2099-12-31")
+
+    assert JOBS_BY_DUE_DATE[TENANT_ID] == sorted(JOBS_BY_DUE_DATE[TENANT_ID])
+
+    late = client.get("/metrics/late-jobs", headers=HEADERS).json()
+    late_ids = [job["job_id"] for job in late["jobs"]]
+    assert late_job_id in late_ids
+    assert future_job_id not in late_ids
+    assert [job["due_date"] for job in late["jobs"]] == sorted(job["due_date"] for job in late["jobs"])
@@ -0,0 +1,32 @@
+import io
+
+from app.core import logger as app_logger
+from app.core.logger import enqueue_log_event, get_logger, shutdown_logging
+
+
+def _capture_console_output():
+    # Point the listener's console handler at a buffer
+    get_logger()
+    _, _, listener = app_logger._queue_logging[-1]
+    stream = io.StringIO()
+    for handler in listener.handlers:
+        handler.setStream(stream)
+    return stream
+
+
+def test_structured_event_name_and_payload_reach_the_console_handler():
+    stream = _capture_console_output()
+    try:
+        enqueue_log_event(
+            "OP_STATUS_CHANGED",
+            {"job_operation_id": "job-1-op-cut", "old_status": "READY", "new_status": "IN_PROGRESS"},
+        )
+    finally:
+        # Stopping the listener drains the queue into the handler
+        shutdown_logging()
+        get_logger()
+
+    output = stream.getvalue()
+    assert "| INFO | jobwork-backend | OP_STATUS_CHANGED | " in output
+    assert '"job_operation_id":"job-1-op-cut"' in output
+    assert '"new_status":"IN_PROGRESS"' in output
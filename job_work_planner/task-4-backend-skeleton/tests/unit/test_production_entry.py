@@ -0,0 +1,32 @@
+import pytest
+
+from app.core import job_operations_service
+from app.core.job_operations_service import _set_op_status, add_production_entry_service
+from app.db.mock_db import JOB_OPERATION_PRODUCTION_TABLE, JOB_OPERATIONS_TABLE
+from tests.helpers import TENANT_ID, create_job
+
+
+def test_production_entry_rechecks_completed_under_the_lock(monkeypatch):
+    _, op_ids = create_job()
+    op_id = op_ids[0]
+    real_now_iso = job_operations_service.now_iso
+
+    # Complete the op after the lock-free check, before the lock is taken
+    def _complete_then_now():
+        _set_op_status(JOB_OPERATIONS_TABLE[op_id], "COMPLETED")
+        return real_now_iso()
+
+    monkeypatch.setattr(job_operations_service, "now_iso", _complete_then_now)
+
+    with pytest.raises(ValueError, match="already COMPLETED"):
+        add_production_entry_service(
+            job_operation_id=op_id,
+            produced_qty=1,
+            scrap_qty=0,
+            rework_qty=0,
+            operator_id="operator-1",
+            tenant_id=TENANT_ID,
+        )
+
+    assert op_id not in JOB_OPERATION_PRODUCTION_TABLE
+    assert JOB_OPERATIONS_TABLE[op_id].total_produced is None
@@ -0,0 +1,44 @@
+import pytest
+
+from app.core.job_operations_service import (
+    add_production_entry_service,
+    plan_job_operation_service,
+    update_job_operation_status,
+)
+from tests.helpers import create_job
+
+
+OTHER_TENANT_ID = "tenant-2"
+
+
+def test_missing_op_is_not_found():
+    with pytest.raises(ValueError, match="Job operation not found"):
+        update_job_operation_status("missing-op", "IN_PROGRESS", tenant_id=OTHER_TENANT_ID, user_id="user-2")
+
+
+def test_other_tenants_op_is_unauthorized():
+    _, op_ids = create_job()
+    op_id = op_ids[0]
+
+    with pytest.raises(ValueError, match="Unauthorized access to job operation"):
+        update_job_operation_status(op_id, "IN_PROGRESS", tenant_id=OTHER_TENANT_ID, user_id="user-2")
+
+    with pytest.raises(ValueError, match="Unauthorized access to job operation"):
+        plan_job_operation_service(
+            op_id,
+            machine_id="machine-1",
+            shift_id="shift-A",
+            planned_start_date="2030-01-01",
+            planned_end_date="2030-01-02",
+            tenant_id=OTHER_TENANT_ID,
+        )
+
+    with pytest.raises(ValueError, match="Unauthorized access to job operation"):
+        add_production_entry_service(
+            job_operation_id=op_id,
+            produced_qty=1,
+            scrap_qty=0,
+            rework_qty=0,
+            operator_id="user-2",
+            tenant_id=OTHER_TENANT_ID,
+        )